@@ -0,0 +1,113 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+from typing import Optional, Union
+
+from .render import _CHUNK_SIZE, _colors_enabled, render_bytes_iter
+from .styled import StyledString, StyledText
+
+
+class AsyncWriter:
+    # Renders values chunk by chunk onto an asyncio.StreamWriter. After every
+    # chunk it waits for drain() and yields to the event loop, so large values
+    # neither block other tasks nor buffer unbounded output in memory.
+    def __init__(
+        self,
+        writer: asyncio.StreamWriter,
+        chunk_size: int = _CHUNK_SIZE,
+        minimal: bool = False,
+        encoding: str = "utf-8",
+        color: Optional[bool] = None,
+    ):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self._writer = writer
+        self._chunk_size = chunk_size
+        self._minimal = minimal
+        self._encoding = encoding
+        self._color = color
+        # for terminal detection; without a pipe or socket the writer itself
+        # stands in, which never counts as a terminal
+        self._target = (
+            writer.get_extra_info("pipe") or writer.get_extra_info("socket") or writer
+        )
+        # set by open_fd(): the descriptor and its blocking mode to restore
+        self._fd: Optional[tuple[int, bool]] = None
+
+    @classmethod
+    async def open_fd(
+        cls,
+        fd: int,
+        chunk_size: int = _CHUNK_SIZE,
+        minimal: bool = False,
+        encoding: str = "utf-8",
+        color: Optional[bool] = None,
+    ) -> "AsyncWriter":
+        # pipes, sockets and terminals; the fd stays open after close()
+        loop = asyncio.get_running_loop()
+        # the transport makes the descriptor non-blocking, which would break
+        # ordinary writes to it after close()
+        blocking = os.get_blocking(fd)
+        pipe = open(fd, "wb", buffering=0, closefd=False)
+        # StreamReaderProtocol provides the flow control and close waiter that
+        # StreamWriter needs; its reader side stays unused
+        transport, protocol = await loop.connect_write_pipe(
+            lambda: asyncio.StreamReaderProtocol(asyncio.StreamReader()), pipe
+        )
+        writer = asyncio.StreamWriter(transport, protocol, None, loop)
+        instance = cls(writer, chunk_size, minimal, encoding, color)
+        instance._fd = (fd, blocking)
+        return instance
+
+    @property
+    def writer(self) -> asyncio.StreamWriter:
+        return self._writer
+
+    async def write(self, value: Union[StyledString, StyledText, str]):
+        if isinstance(value, str):
+            value = StyledString(value)
+        elif (
+            isinstance(value, StyledText)
+            and value._parts is None
+            and len(value) > self._chunk_size
+        ):
+            # rendering starts by flattening the rope, which is too slow for
+            # the event loop when it was built from many concatenations
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, StyledText.parts.fget, value)
+        writer = self._writer
+        color = _colors_enabled(self._color, self._target)
+        for chunk in render_bytes_iter(
+            value, self._chunk_size, self._minimal, self._encoding, color
+        ):
+            writer.write(chunk)
+            await writer.drain()
+            # drain() returns without suspending while the buffer is small
+            await asyncio.sleep(0)
+
+    async def close(self):
+        self._writer.close()
+        await self._writer.wait_closed()
+        if self._fd is not None:
+            fd, blocking = self._fd
+            self._fd = None
+            os.set_blocking(fd, blocking)
+
+    async def __aenter__(self) -> "AsyncWriter":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
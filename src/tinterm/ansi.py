@@ -0,0 +1,169 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from typing import AnyStr, Optional, Union
+
+from .attributes import Color, Modifier, Style
+from .styled import StyledString, StyledText
+
+# CSI sequences (group 1: parameters, group 2: final byte) and OSC sequences
+_ESCAPE = re.compile(r"\x1b(?:\[([0-?]*)[ -/]*([@-~])|\][^\x07\x1b]*(?:\x07|\x1b\\))")
+
+_STRIP = re.compile(r"\x1b(?:\[[0-?]*[ -/]*[@-~]|\][^\x07\x1b]*(?:\x07|\x1b\\))")
+_STRIP_BYTES = re.compile(_STRIP.pattern.encode("ascii"))
+# an escape sequence cut off at the end of a chunk
+_PARTIAL = re.compile(r"\x1b(?:\[[0-?]*[ -/]*|\][^\x07\x1b]*\x1b?)?\Z")
+_PARTIAL_BYTES = re.compile(_PARTIAL.pattern.encode("ascii"))
+# longest unterminated sequence held back between chunks
+_MAX_PENDING = 4096
+
+_RESET, _FOREGROUND, _BACKGROUND, _MODIFIER_ON, _MODIFIER_OFF, _EXTENDED = range(6)
+
+_SGR: dict[str, tuple] = {"": (_RESET,), "0": (_RESET,)}
+for _color in Color:
+    _SGR[str(_color.value.foreground)] = (_FOREGROUND, _color)
+    _SGR[str(_color.value.background)] = (_BACKGROUND, _color)
+for _modifier in Modifier:
+    _SGR[str(_modifier.value)] = (_MODIFIER_ON, _modifier)
+_SGR["39"] = (_FOREGROUND, None)
+_SGR["49"] = (_BACKGROUND, None)
+_SGR["22"] = (_MODIFIER_OFF, (Modifier.BOLD, Modifier.DIM))
+_SGR["23"] = (_MODIFIER_OFF, (Modifier.ITALIC,))
+_SGR["24"] = (_MODIFIER_OFF, (Modifier.UNDERLINE,))
+_SGR["25"] = (_MODIFIER_OFF, (Modifier.BLINK,))
+_SGR["27"] = (_MODIFIER_OFF, (Modifier.REVERSE,))
+_SGR["29"] = (_MODIFIER_OFF, (Modifier.STRIKETHROUGH,))
+# 256-colour and true-colour selectors have no Color equivalent and are skipped
+_SGR["38"] = _SGR["48"] = _SGR["58"] = (_EXTENDED,)
+del _color, _modifier
+
+_PLAIN = Style()
+_TRANSITIONS: dict[tuple[Style, str], Style] = {}
+_MAX_TRANSITIONS = 4096
+
+
+def _apply_sgr(style: Style, params: str) -> Style:
+    foreground = style.foreground
+    background = style.background
+    modifiers = list(style.modifiers)
+
+    codes = params.split(";")
+    i = 0
+    while i < len(codes):
+        action = _SGR.get(codes[i])
+        i += 1
+        if action is None:
+            continue
+        kind = action[0]
+        if kind == _RESET:
+            foreground = background = None
+            modifiers = []
+        elif kind == _FOREGROUND:
+            foreground = action[1]
+        elif kind == _BACKGROUND:
+            background = action[1]
+        elif kind == _MODIFIER_ON:
+            if action[1] not in modifiers:
+                modifiers.append(action[1])
+        elif kind == _MODIFIER_OFF:
+            modifiers = [m for m in modifiers if m not in action[1]]
+        elif i < len(codes):
+            # skip the arguments of 38;5;n and 38;2;r;g;b
+            i += {"5": 2, "2": 4}.get(codes[i], 0)
+
+    result = Style(foreground, background, modifiers)
+    if len(_TRANSITIONS) >= _MAX_TRANSITIONS:
+        # arbitrary input can carry unbounded parameter variations
+        _TRANSITIONS.clear()
+    _TRANSITIONS[(style, params)] = result
+    return result
+
+
+def parse_ansi(text: str) -> StyledText:
+    if "\x1b" not in text:
+        return StyledText((StyledString(text),) if text else ())
+
+    # split() yields text, parameters, final byte, text, ...; for OSC
+    # sequences both captured groups are None
+    pieces = _ESCAPE.split(text)
+    parts: list[StyledString] = []
+    style = _PLAIN
+    # an SGR followed directly by a reset is how render() writes an empty part
+    pending = False
+
+    if pieces[0]:
+        parts.append(StyledString(pieces[0], style))
+
+    for i in range(1, len(pieces), 3):
+        if pieces[i + 1] == "m":
+            params = pieces[i]
+            reset = params == "" or params == "0"
+            if reset and pending and style is not _PLAIN:
+                parts.append(StyledString("", style))
+            pending = not reset
+
+            following = _TRANSITIONS.get((style, params))
+            if following is None:
+                following = _apply_sgr(style, params)
+            style = following
+
+        chunk = pieces[i + 2]
+        if chunk:
+            parts.append(StyledString(chunk, style))
+            pending = False
+
+    return StyledText(parts)
+
+
+def strip_ansi(value: AnyStr) -> AnyStr:
+    if isinstance(value, str):
+        return _STRIP.sub("", value) if "\x1b" in value else value
+    return _STRIP_BYTES.sub(b"", value) if b"\x1b" in value else value
+
+
+class AnsiStripper:
+    # Streaming strip_ansi(): escape sequences split across chunk boundaries
+    # are held back until the next chunk completes them.
+    __slots__ = ("_pending",)
+
+    def __init__(self):
+        self._pending: Optional[Union[str, bytes]] = None
+
+    def feed(self, chunk: AnyStr) -> AnyStr:
+        if self._pending:
+            chunk = self._pending + chunk
+        # empty, but of the same type as the input for flush()
+        self._pending = chunk[:0]
+
+        if isinstance(chunk, str):
+            has_escape = "\x1b" in chunk
+            partial = _PARTIAL
+        else:
+            has_escape = b"\x1b" in chunk
+            partial = _PARTIAL_BYTES
+        if not has_escape:
+            return chunk
+
+        tail = partial.search(chunk, max(0, len(chunk) - _MAX_PENDING))
+        if tail is not None:
+            self._pending = chunk[tail.start() :]
+            chunk = chunk[: tail.start()]
+        return strip_ansi(chunk)
+
+    def flush(self) -> Union[str, bytes]:
+        # an unterminated sequence at the end of the input is passed through
+        pending = self._pending
+        self._pending = None
+        return pending if pending is not None else ""
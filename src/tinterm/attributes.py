@@ -12,8 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import Enum, IntEnum
+from typing import Any, Iterable, Iterator, Optional
 
 
 class Modifier(IntEnum):
@@ -56,3 +60,122 @@ class StyleKey(Enum):
     FOREGROUND = "style_key_foreground"
     BACKGROUND = "style_key_background"
     MODIFIERS = "style_key_modifiers"
+
+
+class Style(Mapping):
+    # Immutable and interned: identical attribute sets share one instance,
+    # and the SGR escape prefix is computed once when the style is built.
+    __slots__ = (
+        "_foreground",
+        "_background",
+        "_modifiers",
+        "_items",
+        "_prefix",
+        "_prefix_bytes",
+    )
+
+    _interned: dict[tuple, Style] = {}
+
+    def __new__(
+        cls,
+        foreground: Optional[Color] = None,
+        background: Optional[Color] = None,
+        modifiers: Iterable[Modifier] = (),
+    ) -> Style:
+        if not isinstance(foreground, Color):
+            foreground = None
+        if not isinstance(background, Color):
+            background = None
+        mods = tuple(dict.fromkeys(m for m in modifiers if isinstance(m, Modifier)))
+
+        key = (foreground, background, mods)
+        style = cls._interned.get(key)
+        if style is not None:
+            return style
+
+        style = super().__new__(cls)
+        items: dict[StyleKey, Any] = {}
+        codes: list[str] = []
+        if foreground is not None:
+            items[StyleKey.FOREGROUND] = foreground
+            codes.append(str(foreground.value.foreground))
+        if background is not None:
+            items[StyleKey.BACKGROUND] = background
+            codes.append(str(background.value.background))
+        if mods:
+            items[StyleKey.MODIFIERS] = mods
+            codes.extend(str(m.value) for m in mods)
+
+        setattr_ = object.__setattr__
+        setattr_(style, "_foreground", foreground)
+        setattr_(style, "_background", background)
+        setattr_(style, "_modifiers", mods)
+        setattr_(style, "_items", items)
+        setattr_(style, "_prefix", f"\033[{';'.join(codes)}m" if codes else "")
+        setattr_(style, "_prefix_bytes", style._prefix.encode("ascii"))
+
+        # setdefault keeps interning correct when two threads race here
+        return cls._interned.setdefault(key, style)
+
+    @classmethod
+    def from_mapping(cls, style: Mapping[StyleKey, Any]) -> Style:
+        if isinstance(style, Style):
+            return style
+        return cls(
+            style.get(StyleKey.FOREGROUND),
+            style.get(StyleKey.BACKGROUND),
+            style.get(StyleKey.MODIFIERS) or (),
+        )
+
+    @property
+    def foreground(self) -> Optional[Color]:
+        return self._foreground
+
+    @property
+    def background(self) -> Optional[Color]:
+        return self._background
+
+    @property
+    def modifiers(self) -> tuple[Modifier, ...]:
+        return self._modifiers
+
+    @property
+    def prefix(self) -> str:
+        return self._prefix
+
+    @property
+    def prefix_bytes(self) -> bytes:
+        return self._prefix_bytes
+
+    def __getitem__(self, key: StyleKey) -> Any:
+        return self._items[key]
+
+    def __iter__(self) -> Iterator[StyleKey]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Style):
+            return self is other
+        return Mapping.__eq__(self, other)
+
+    # interned, so identity hashing is both correct and cheapest
+    __hash__ = object.__hash__
+
+    def __reduce__(self) -> tuple:
+        # unpickling goes through __new__, so loaded styles are interned too
+        return (Style, (self._foreground, self._background, self._modifiers))
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return (
+            f"Style(foreground={self._foreground}, background={self._background}, "
+            f"modifiers={list(self._modifiers)})"
+        )
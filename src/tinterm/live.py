@@ -0,0 +1,229 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextvars
+import io
+import sys
+import threading
+from time import monotonic
+from typing import BinaryIO, Optional, TextIO, Union
+
+from .render import _colors_enabled, render
+from .styled import StyledString, StyledText
+
+_CLEAR_BELOW = "\033[J"
+_CLEAR_RIGHT = "\033[K"
+
+
+def _up(lines: int) -> str:
+    # back to the start of the first of the given number of lines
+    return f"\r\033[{lines - 1}A" if lines > 1 else "\r"
+
+
+def _move(rows: int) -> str:
+    if rows < 0:
+        return f"\r\033[{-rows}A"
+    if rows > 0:
+        return f"\r\033[{rows}B"
+    return "\r"
+
+
+def _render_line(
+    value: Union[StyledString, StyledText, str], color: Optional[bool]
+) -> str:
+    return value if isinstance(value, str) else render(value, True, color)
+
+
+def _is_binary(stream: Union[TextIO, BinaryIO]) -> bool:
+    return isinstance(stream, (io.RawIOBase, io.BufferedIOBase))
+
+
+def _write(stream: Union[TextIO, BinaryIO], binary: bool, data: str, encoding: str):
+    stream.write(data.encode(encoding) if binary else data)
+    stream.flush()
+
+
+class Live:
+    # A region at the bottom of the terminal that is redrawn in place. Updates
+    # are coalesced: only the latest value is drawn, at most refresh_rate
+    # times per second, and each frame is written with a single write(). An
+    # update that arrives too early is drawn by a timer once the interval is
+    # over, so the region never lags behind by more than one interval.
+    def __init__(
+        self,
+        stream: Optional[Union[TextIO, BinaryIO]] = None,
+        refresh_rate: float = 10.0,
+        encoding: str = "utf-8",
+        color: Optional[bool] = None,
+    ):
+        if refresh_rate <= 0:
+            raise ValueError("refresh_rate must be positive")
+        self._stream = stream if stream is not None else sys.stdout
+        self._binary = _is_binary(self._stream)
+        self._encoding = encoding
+        self._color = color
+        self._interval = 1.0 / refresh_rate
+        self._next = 0.0
+        self._pending: Optional[Union[StyledString, StyledText, str]] = None
+        self._height = 0
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def update(self, value: Union[StyledString, StyledText, str]):
+        self._pending = value
+        now = monotonic()
+        if now >= self._next:
+            self.refresh()
+        elif self._timer is None:
+            self._schedule(self._next - now)
+
+    def _schedule(self, delay: float):
+        # the timer thread draws with the color setting of this context
+        context = contextvars.copy_context()
+        timer = threading.Timer(delay, context.run, args=(self._trailing,))
+        timer.daemon = True
+        self._timer = timer
+        timer.start()
+
+    def _trailing(self):
+        self._timer = None
+        self.refresh()
+
+    def refresh(self):
+        with self._lock:
+            value = self._pending
+            if value is None:
+                return
+            self._pending = None
+            self._next = monotonic() + self._interval
+
+            text = _render_line(value, _colors_enabled(self._color, self._stream))
+            frame = (_up(self._height) if self._height else "") + _CLEAR_BELOW + text
+            self._height = str(value).count("\n") + 1
+            _write(self._stream, self._binary, frame, self._encoding)
+
+    def close(self):
+        # draws the final state and moves below the region
+        timer = self._timer
+        if timer is not None:
+            timer.cancel()
+            self._timer = None
+        self.refresh()
+        with self._lock:
+            if self._height:
+                _write(self._stream, self._binary, "\n", self._encoding)
+                self._height = 0
+
+    def __enter__(self) -> "Live":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class LiveStatus:
+    # One status line per slot, e.g. per worker thread. set() is a single list
+    # item store, which is atomic, so workers never take a lock; a background
+    # thread redraws the slots whose value changed since the previous frame.
+    def __init__(
+        self,
+        slots: int,
+        stream: Optional[Union[TextIO, BinaryIO]] = None,
+        refresh_rate: float = 10.0,
+        encoding: str = "utf-8",
+        color: Optional[bool] = None,
+    ):
+        if slots <= 0:
+            raise ValueError("slots must be positive")
+        if refresh_rate <= 0:
+            raise ValueError("refresh_rate must be positive")
+        self._stream = stream if stream is not None else sys.stdout
+        self._binary = _is_binary(self._stream)
+        self._encoding = encoding
+        self._color = color
+        self._interval = 1.0 / refresh_rate
+        self._values: list[Union[StyledString, StyledText, str]] = [""] * slots
+        self._drawn: Optional[list[Union[StyledString, StyledText, str]]] = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def set(self, slot: int, value: Union[StyledString, StyledText, str]):
+        # values must be single lines
+        self._values[slot] = value
+
+    def refresh(self):
+        values = self._values.copy()
+        drawn = self._drawn
+        color = _colors_enabled(self._color, self._stream)
+        last = len(values) - 1
+
+        if drawn is None:
+            frame = "\n".join([_render_line(v, color) for v in values])
+        else:
+            out: list[str] = []
+            row = last
+            for i, value in enumerate(values):
+                if value is drawn[i]:
+                    continue
+                out.append(_move(i - row))
+                out.append(_render_line(value, color))
+                out.append(_CLEAR_RIGHT)
+                row = i
+            if not out:
+                return
+            # the cursor rests on the last line between frames
+            if row != last:
+                out.append(_move(last - row))
+            frame = "".join(out)
+
+        self._drawn = values
+        _write(self._stream, self._binary, frame, self._encoding)
+
+    def _run(self):
+        while not self._stopped.wait(self._interval):
+            self.refresh()
+
+    def start(self):
+        if self._thread is not None:
+            raise RuntimeError("LiveStatus is already running")
+        self._stopped.clear()
+        self.refresh()
+        # redraws follow the color setting of the starting context
+        context = contextvars.copy_context()
+        self._thread = threading.Thread(
+            target=context.run, args=(self._run,), name="tinterm-live", daemon=True
+        )
+        self._thread.start()
+
+    def close(self):
+        # draws the final state and moves below the region
+        thread = self._thread
+        if thread is not None:
+            self._stopped.set()
+            thread.join()
+            self._thread = None
+        if self._drawn is not None:
+            self.refresh()
+            _write(self._stream, self._binary, "\n", self._encoding)
+            self._drawn = None
+
+    def __enter__(self) -> "LiveStatus":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,121 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import re
+from bisect import bisect_right
+from typing import Any, Mapping, Optional, Union
+
+from .attributes import Color, Modifier, Style
+from .render import _RESET, _colors_enabled, use_colors
+
+DEFAULT_LEVEL_STYLES: Mapping[int, Style] = {
+    logging.DEBUG: Style(Color.BLUE),
+    logging.INFO: Style(Color.GREEN),
+    logging.WARNING: Style(Color.YELLOW),
+    logging.ERROR: Style(Color.RED),
+    logging.CRITICAL: Style(Color.RED, modifiers=(Modifier.BOLD,)),
+}
+
+# the levelname field of each format style, including conversions and specs
+_LEVELNAME = {
+    logging.PercentStyle: re.compile(
+        r"%\(levelname\)[#0+ -]*(?:\*|\d+)?(?:\.(?:\*|\d+))?[diouxXeEfFgGcrsa]"
+    ),
+    logging.StrFormatStyle: re.compile(r"\{levelname(?:![rsa])?(?::[^{}]*)?\}"),
+    logging.StringTemplateStyle: re.compile(r"\$(?:levelname\b|\{levelname\})"),
+}
+
+
+class Formatter(logging.Formatter):
+    # Colors the level name of each record. The format string is rewritten
+    # once per level with the level's SGR prefix around the levelname field,
+    # so formatting a record is the plain logging substitution.
+    # colors=None follows enable_colors()/disable_colors(); True or False
+    # fixes the setting for the handlers using this formatter.
+    def __init__(
+        self,
+        fmt: Optional[str] = None,
+        datefmt: Optional[str] = None,
+        style: str = "%",
+        validate: bool = True,
+        *,
+        defaults: Optional[Mapping[str, Any]] = None,
+        level_styles: Optional[Mapping[int, Union[Style, Mapping]]] = None,
+        colors: Optional[bool] = None,
+    ):
+        if defaults is None:
+            super().__init__(fmt, datefmt, style, validate)
+        else:
+            # Python 3.10 and later
+            super().__init__(fmt, datefmt, style, validate, defaults=defaults)
+        styles = dict(DEFAULT_LEVEL_STYLES)
+        if level_styles is not None:
+            styles.update(
+                (level, s if isinstance(s, Style) else Style.from_mapping(s))
+                for level, s in level_styles.items()
+            )
+        self._levels = sorted(styles)
+        self._level_styles = [styles[level] for level in self._levels]
+        self._colors = colors
+        self._templates: dict[int, logging.PercentStyle] = {}
+
+    def _style_for(self, levelno: int) -> Optional[Style]:
+        # custom levels use the style of the closest level below them
+        i = bisect_right(self._levels, levelno) - 1
+        return self._level_styles[i] if i >= 0 else None
+
+    def _template(self, levelno: int) -> logging.PercentStyle:
+        base = self._style
+        style = self._style_for(levelno)
+        pattern = _LEVELNAME.get(type(base))
+        if style is None or not style.prefix or pattern is None:
+            template = base
+        else:
+            prefix = style.prefix
+            fmt = pattern.sub(lambda m: prefix + m.group() + _RESET, base._fmt)
+            template = type(base)(fmt)
+            defaults = getattr(base, "_defaults", None)
+            if defaults:
+                template._defaults = defaults
+        self._templates[levelno] = template
+        return template
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        colors = self._colors
+        if colors is None:
+            colors = _colors_enabled()
+        if not colors:
+            return self._style.format(record)
+        template = self._templates.get(record.levelno)
+        if template is None:
+            template = self._template(record.levelno)
+        return template.format(record)
+
+
+class StreamColorsMixin:
+    # For logging.StreamHandler and its subclasses: detects automatic colors
+    # (auto_colors()) on the handler's own stream while formatting a record,
+    # instead of on sys.stdout. Explicit settings are kept as they are.
+    def format(self, record: logging.LogRecord) -> str:
+        with use_colors(_colors_enabled(None, self.stream)):
+            return super().format(record)
+
+
+class StreamHandler(StreamColorsMixin, logging.StreamHandler):
+    pass
+
+
+class FileHandler(StreamColorsMixin, logging.FileHandler):
+    pass
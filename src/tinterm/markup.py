@@ -0,0 +1,166 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Optional
+
+from .attributes import Color, Modifier, Style
+from .styled import StyledString, StyledText
+
+# an escaped bracket, or a tag; group 1 is "/" for closing tags
+_TOKEN = re.compile(r"\\\[|\[(/?)([a-z_ ]*)\]")
+_COLORS = {color.name.lower(): color for color in Color}
+_MODIFIERS = {modifier.name.lower(): modifier for modifier in Modifier}
+_PLAIN = Style()
+_FORMATTER = Formatter()
+
+_MAX_TAGS = 4096
+
+_tags: dict[str, Optional[Style]] = {}
+
+
+def _parse_tag(tag: str) -> Optional[Style]:
+    # "red bold on blue" -> the attributes it sets, or None if it is not a tag
+    foreground = background = None
+    modifiers: list[Modifier] = []
+    words = iter(tag.split())
+    valid = bool(tag.strip())
+    for word in words:
+        if word == "on":
+            background = _COLORS.get(next(words, ""))
+            valid = valid and background is not None
+        elif word in _COLORS:
+            foreground = _COLORS[word]
+        elif word in _MODIFIERS:
+            modifiers.append(_MODIFIERS[word])
+        else:
+            valid = False
+    result = Style(foreground, background, modifiers) if valid else None
+    if len(_tags) >= _MAX_TAGS:
+        _tags.clear()
+    _tags[tag] = result
+    return result
+
+
+def _nest(outer: Style, inner: Style) -> Style:
+    return Style(
+        inner.foreground if inner.foreground is not None else outer.foreground,
+        inner.background if inner.background is not None else outer.background,
+        outer.modifiers + inner.modifiers,
+    )
+
+
+def _fields(text: str) -> tuple[str, Optional[str]]:
+    # the text with {{ and }} unescaped and fields kept as written, and the
+    # format string to substitute values with, or None if it has no fields
+    try:
+        pieces = list(_FORMATTER.parse(text))
+    except ValueError:
+        # unbalanced braces: left as they are, format_map() reports them
+        return text, text
+    if all(field is None for _, field, _, _ in pieces):
+        return "".join(literal for literal, _, _, _ in pieces), None
+    unescaped: list[str] = []
+    for literal, field, spec, conversion in pieces:
+        unescaped.append(literal)
+        if field is not None:
+            unescaped.append("{" + field)
+            if conversion:
+                unescaped.append("!" + conversion)
+            if spec:
+                unescaped.append(":" + spec)
+            unescaped.append("}")
+    return "".join(unescaped), text
+
+
+@lru_cache(maxsize=1024)
+def _parse(text: str) -> tuple[StyledText, tuple[Optional[str], ...]]:
+    # the parsed text, and the format string of each of its parts
+    parts: list[StyledString] = []
+    # open tags, innermost last: name, attributes, style in effect inside
+    stack: list[tuple[str, Style, Style]] = []
+    style = _PLAIN
+    pending: list[str] = []
+    position = 0
+
+    for match in _TOKEN.finditer(text):
+        pending.append(text[position : match.start()])
+        position = match.end()
+        closing, tag = match.groups()
+
+        if tag is None:
+            pending.append("[")
+            continue
+        if closing:
+            # [/] closes the innermost tag, [/name] the innermost one named so
+            names = [entry[0] for entry in stack]
+            if not stack or (tag and tag not in names):
+                pending.append(match.group())
+                continue
+            index = len(names) - 1
+            if tag:
+                index -= names[::-1].index(tag)
+            del stack[index]
+            following = stack[index - 1][2] if index else _PLAIN
+            # a tag closed out of order: restyle the ones opened after it
+            for i in range(index, len(stack)):
+                name, attributes, _ = stack[i]
+                following = _nest(following, attributes)
+                stack[i] = (name, attributes, following)
+        else:
+            attributes = _tags.get(tag) if tag in _tags else _parse_tag(tag)
+            if attributes is None:
+                pending.append(match.group())
+                continue
+            following = _nest(style, attributes)
+            stack.append((tag, attributes, following))
+
+        if following is not style:
+            content = "".join(pending)
+            if content:
+                parts.append(StyledString(content, style))
+            pending.clear()
+            style = following
+
+    pending.append(text[position:])
+    content = "".join(pending)
+    if content:
+        parts.append(StyledString(content, style))
+
+    formats: list[Optional[str]] = []
+    for i, part in enumerate(parts):
+        if "{" in part._text or "}" in part._text:
+            unescaped, pattern = _fields(part._text)
+            parts[i] = part._derive(unescaped)
+            formats.append(pattern)
+        else:
+            formats.append(None)
+    return StyledText(parts), tuple(formats)
+
+
+def markup(text: str, /, **values: Any) -> StyledText:
+    # parsed markup is cached, values are substituted into the parsed parts,
+    # so they are never interpreted as markup themselves. {{ and }} are
+    # unescaped either way; without values, fields are kept as written.
+    parsed, formats = _parse(text)
+    if not values:
+        return parsed
+    return StyledText(
+        [
+            p if pattern is None else p._derive(pattern.format_map(values))
+            for p, pattern in zip(parsed.parts, formats)
+        ]
+    )
@@ -12,29 +12,36 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections import deque
-from typing import Union
+import io
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, BinaryIO, Iterator, Optional, TextIO, Union
 
-from .attributes import Color, Modifier, StyleKey
+from .attributes import Modifier, Style
 from .styled import StyledString, StyledText
+from .terminal import detect
 
-_ENABLED: bool = True
-_EXTRACTORS = [
-    (
-        StyleKey.FOREGROUND,
-        lambda c: str(c.value.foreground) if isinstance(c, Color) else None,
-    ),
-    (
-        StyleKey.BACKGROUND,
-        lambda c: str(c.value.background) if isinstance(c, Color) else None,
-    ),
-    (
-        StyleKey.MODIFIERS,
-        lambda mods: (
-            [str(m.value) for m in mods if isinstance(m, Modifier)] if mods else []
-        ),
-    ),
-]
+# the process-wide default (None: detect it from the output stream), and an
+# override for the current thread or task
+_ENABLED: Optional[bool] = True
+_COLOR: ContextVar[Optional[bool]] = ContextVar("tinterm_color", default=None)
+_RESET = "\033[0m"
+_RESET_BYTES = b"\033[0m"
+_CHUNK_SIZE = 64 * 1024
+_PLAIN = Style()
+
+_MODIFIER_OFF = {
+    Modifier.BOLD: "22",
+    Modifier.DIM: "22",
+    Modifier.ITALIC: "23",
+    Modifier.UNDERLINE: "24",
+    Modifier.BLINK: "25",
+    Modifier.REVERSE: "27",
+    Modifier.STRIKETHROUGH: "29",
+}
+_INTENSITY = (Modifier.BOLD, Modifier.DIM)
+_TRANSITIONS: dict[tuple[Style, Style], str] = {}
+_TRANSITION_BYTES: dict[tuple[Style, Style], bytes] = {}
 
 
 def enable_colors():
@@ -47,47 +54,299 @@ def disable_colors():
     _ENABLED = False
 
 
-def _render_no_color(value: Union[StyledString, StyledText]) -> str:
-    stack = deque([value])
-    result: list[str] = []
+def auto_colors():
+    global _ENABLED
+    _ENABLED = None
+
+
+@contextmanager
+def use_colors(enabled: Optional[bool]) -> Iterator[None]:
+    # None falls back to enable_colors()/disable_colors() again
+    token = _COLOR.set(enabled)
+    try:
+        yield
+    finally:
+        _COLOR.reset(token)
+
+
+def _colors_enabled(color: Optional[bool] = None, stream: Any = None) -> bool:
+    # stream is where the output goes, sys.stdout if not known
+    if color is None:
+        color = _COLOR.get()
+        if color is None:
+            color = _ENABLED
+            if color is None:
+                return detect(stream).color
+    return color
+
+
+def _leaves(value: Union[StyledString, StyledText]) -> Iterator[StyledString]:
+    # iterators over the parts, not copies of them: copying a large text's
+    # parts up front would hold up the first chunk
+    stack = [iter((value,))]
 
     while stack:
-        v = stack.popleft()
-        if isinstance(v, StyledText):
-            stack.extendleft(reversed(v.parts))
+        for v in stack[-1]:
+            if isinstance(v, StyledText):
+                stack.append(iter(v.parts))
+                break
+            yield v
         else:
-            result.append(str(v))
+            stack.pop()
+
 
-    return "".join(result)
+def _encode(text: str, encoding: str) -> Iterator[bytes]:
+    # very long texts are encoded piecewise to bound each step
+    for start in range(0, len(text), _CHUNK_SIZE):
+        yield text[start : start + _CHUNK_SIZE].encode(encoding)
 
 
-def render(value: Union[StyledString, StyledText]) -> str:
-    if not _ENABLED:
-        return _render_no_color(value)
+def _render_no_color(value: Union[StyledString, StyledText]) -> str:
+    return "".join([str(v) for v in _leaves(value)])
 
-    stack = deque([value])
-    result: list[str] = []
 
-    while stack:
-        v = stack.popleft()
-        if isinstance(v, StyledText):
-            stack.extendleft(reversed(v.parts))
-            continue
+def _transition(current: Style, target: Style) -> str:
+    key = (current, target)
+    sgr = _TRANSITIONS.get(key)
+    if sgr is not None:
+        return sgr
 
-        text = str(v)
+    if target is _PLAIN:
+        sgr = _RESET
+    else:
         codes: list[str] = []
+        if current.foreground is not target.foreground:
+            codes.append(
+                str(target.foreground.value.foreground) if target.foreground else "39"
+            )
+        if current.background is not target.background:
+            codes.append(
+                str(target.background.value.background) if target.background else "49"
+            )
 
-        for key, extractor in _EXTRACTORS:
-            val = v.style.get(key)
-            res = extractor(val)
-            if isinstance(res, list):
-                codes.extend(res)
-            elif res:
-                codes.append(res)
+        # sorted, so the result only depends on the attributes, not their order
+        removed = set(current.modifiers).difference(target.modifiers)
+        added = set(target.modifiers).difference(current.modifiers)
+        offs = sorted({_MODIFIER_OFF[m] for m in removed})
+        if "22" in offs:
+            # 22 clears both bold and dim, so whichever one stays must be re-set
+            added.update(m for m in target.modifiers if m in _INTENSITY)
+        codes.extend(offs)
+        codes.extend(str(m.value) for m in sorted(added))
 
-        if codes:
-            result.append(f"\033[{';'.join(codes)}m{text}\033[0m")
+        if not codes:
+            # the same attributes with the modifiers in another order; an
+            # empty "\033[m" would be read as a reset
+            sgr = ""
         else:
-            result.append(text)
+            sgr = f"\033[{';'.join(codes)}m"
+            full = "\033[0;" + target.prefix[2:]
+            if len(full) < len(sgr):
+                sgr = full
+
+    _TRANSITIONS[key] = sgr
+    return sgr
+
+
+def _segments(
+    value: Union[StyledString, StyledText],
+    minimal: bool = False,
+    color: Optional[bool] = None,
+) -> Iterator[str]:
+    if not _colors_enabled(color):
+        for v in _leaves(value):
+            yield str(v)
+        return
+
+    if not minimal:
+        for v in _leaves(value):
+            prefix = v._compiled._prefix
+            if prefix:
+                yield prefix
+                yield v._text
+                yield _RESET
+            else:
+                yield v._text
+        return
+
+    state = _PLAIN
+    for v in _leaves(value):
+        text = v._text
+        if not text:
+            continue
+        style = v._compiled
+        if style is not state:
+            sgr = _TRANSITIONS.get((state, style))
+            yield _transition(state, style) if sgr is None else sgr
+            state = style
+        yield text
+
+    if state is not _PLAIN:
+        yield _RESET
+
+
+def _transition_bytes(current: Style, target: Style) -> bytes:
+    sgr = _transition(current, target).encode("ascii")
+    _TRANSITION_BYTES[(current, target)] = sgr
+    return sgr
+
+
+def _encoded_segments(
+    value: Union[StyledString, StyledText],
+    minimal: bool,
+    encoding: str,
+    color: Optional[bool] = None,
+) -> Iterator[bytes]:
+    # mirrors _segments, but with the pre-encoded SGR prefixes of each style
+    if not _colors_enabled(color):
+        for v in _leaves(value):
+            text = v._text
+            if len(text) > _CHUNK_SIZE:
+                yield from _encode(text, encoding)
+            else:
+                yield text.encode(encoding)
+        return
+
+    if not minimal:
+        for v in _leaves(value):
+            text = v._text
+            prefix = v._compiled._prefix_bytes
+            if prefix:
+                yield prefix
+            if len(text) > _CHUNK_SIZE:
+                yield from _encode(text, encoding)
+            else:
+                yield text.encode(encoding)
+            if prefix:
+                yield _RESET_BYTES
+        return
+
+    state = _PLAIN
+    for v in _leaves(value):
+        text = v._text
+        if not text:
+            continue
+        style = v._compiled
+        if style is not state:
+            sgr = _TRANSITION_BYTES.get((state, style))
+            yield _transition_bytes(state, style) if sgr is None else sgr
+            state = style
+        if len(text) > _CHUNK_SIZE:
+            yield from _encode(text, encoding)
+        else:
+            yield text.encode(encoding)
+
+    if state is not _PLAIN:
+        yield _RESET_BYTES
+
+
+def render(
+    value: Union[StyledString, StyledText],
+    minimal: bool = False,
+    color: Optional[bool] = None,
+) -> str:
+    return "".join(_segments(value, minimal, color))
+
+
+def render_iter(
+    value: Union[StyledString, StyledText],
+    chunk_size: int = _CHUNK_SIZE,
+    minimal: bool = False,
+    color: Optional[bool] = None,
+) -> Iterator[str]:
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    buffer: list[str] = []
+    size = 0
+
+    for segment in _segments(value, minimal, color):
+        buffer.append(segment)
+        size += len(segment)
+        if size < chunk_size:
+            continue
+
+        data = "".join(buffer)
+        start = 0
+        while size - start >= chunk_size:
+            yield data[start : start + chunk_size]
+            start += chunk_size
+        buffer = [data[start:]] if start < size else []
+        size -= start
+
+    if size:
+        yield "".join(buffer)
+
+
+def render_bytes(
+    value: Union[StyledString, StyledText],
+    minimal: bool = False,
+    encoding: str = "utf-8",
+    color: Optional[bool] = None,
+) -> bytes:
+    return b"".join(_encoded_segments(value, minimal, encoding, color))
+
+
+def render_bytes_iter(
+    value: Union[StyledString, StyledText],
+    chunk_size: int = _CHUNK_SIZE,
+    minimal: bool = False,
+    encoding: str = "utf-8",
+    color: Optional[bool] = None,
+) -> Iterator[bytes]:
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    buffer = bytearray()
+
+    for segment in _encoded_segments(value, minimal, encoding, color):
+        buffer += segment
+        if len(buffer) < chunk_size:
+            continue
+
+        start = 0
+        with memoryview(buffer) as view:
+            while len(buffer) - start >= chunk_size:
+                yield bytes(view[start : start + chunk_size])
+                start += chunk_size
+        del buffer[:start]
+
+    if buffer:
+        yield bytes(buffer)
+
+
+def _write_all(stream: BinaryIO, data: bytearray):
+    if not isinstance(stream, io.RawIOBase):
+        stream.write(data)
+        return
+
+    # raw streams may accept only part of the data per call
+    offset = 0
+    with memoryview(data) as view:
+        while offset < len(data):
+            with view[offset:] as rest:
+                offset += stream.write(rest) or 0
+
 
-    return "".join(result)
+def render_to(
+    value: Union[StyledString, StyledText],
+    stream: Union[TextIO, BinaryIO],
+    chunk_size: int = _CHUNK_SIZE,
+    minimal: bool = False,
+    encoding: str = "utf-8",
+    color: Optional[bool] = None,
+):
+    color = _colors_enabled(color, stream)
+    if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+        # one reusable buffer; streams must not keep a reference after write()
+        buffer = bytearray()
+        for segment in _encoded_segments(value, minimal, encoding, color):
+            buffer += segment
+            if len(buffer) >= chunk_size:
+                _write_all(stream, buffer)
+                buffer.clear()
+        if buffer:
+            _write_all(stream, buffer)
+    else:
+        for chunk in render_iter(value, chunk_size, minimal, color):
+            stream.write(chunk)
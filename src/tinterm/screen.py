@@ -0,0 +1,239 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+from typing import Any, BinaryIO, Iterable, Optional, TextIO, Union
+
+from .attributes import Style
+from .render import _RESET, _TRANSITIONS, _colors_enabled, _leaves, _transition
+from .styled import StyledString, StyledText
+from .width import _VARIATION_SELECTOR_16, char_width
+
+_PLAIN = Style()
+_BLANK = " "
+# the right half of a wide character
+_WIDE = ""
+_CLEAR = "\033[H\033[2J"
+# unchanged cells between two changes that are rewritten rather than skipped
+# with a cursor move, which costs at least as many bytes
+_MAX_GAP = 4
+
+
+def _is_control(char: str) -> bool:
+    return char < " " or "\x7f" <= char <= "\x9f"
+
+
+def _cells(value: Any, width: int) -> tuple[list[str], list[Style]]:
+    chars: list[str] = []
+    styles: list[Style] = []
+    if isinstance(value, (StyledString, StyledText)):
+        runs = ((v._text, v._compiled) for v in _leaves(value))
+    else:
+        runs = ((str(value), _PLAIN),)
+
+    for text, style in runs:
+        if len(chars) >= width:
+            break
+        if text.isascii() and text.isprintable():
+            piece = text[: width - len(chars)]
+            chars.extend(piece)
+            styles.extend([style] * len(piece))
+            continue
+
+        for char in text:
+            w = char_width(char)
+            if w == 1:
+                if len(chars) >= width:
+                    break
+                chars.append(char)
+                styles.append(style)
+            elif w == 2:
+                if len(chars) + 2 > width:
+                    # a wide character that doesn't fit is left out entirely,
+                    # and so is everything after it
+                    width = len(chars)
+                    break
+                chars += (char, _WIDE)
+                styles += (style, style)
+            elif chars and not _is_control(char):
+                # combining marks and variation selectors join the previous cell
+                i = -2 if chars[-1] == _WIDE else -1
+                chars[i] += char
+                if (
+                    char == _VARIATION_SELECTOR_16
+                    and i == -1
+                    and len(chars) < width
+                    and char_width(chars[-1][0]) == 1
+                ):
+                    chars.append(_WIDE)
+                    styles.append(styles[-1])
+
+    return chars, styles
+
+
+def _pad_cells(chars: list[str], styles: list[Style], width: int):
+    missing = width - len(chars)
+    if missing > 0:
+        chars.extend(_BLANK * missing)
+        styles.extend([_PLAIN] * missing)
+
+
+class Screen:
+    # A width x height grid of (character, style) cells. frame() compares the
+    # cells with those of the previous frame and only writes the runs that
+    # changed, positioned with cursor movements.
+    __slots__ = ("_width", "_height", "_chars", "_styles", "_shown", "_clear")
+
+    def __init__(self, width: int, height: int):
+        if width <= 0 or height <= 0:
+            raise ValueError("width and height must be positive")
+        self._width = width
+        self._height = height
+        self._chars = [[_BLANK] * width for _ in range(height)]
+        self._styles = [[_PLAIN] * width for _ in range(height)]
+        # rows of the back buffer are replaced, never modified, so the last
+        # frame can share them
+        self._shown = (list(self._chars), list(self._styles))
+        self._clear = True
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    def set_line(self, row: int, value: Union[StyledString, StyledText, str]):
+        if not -self._height <= row < self._height:
+            raise IndexError("row out of range")
+        chars, styles = _cells(value, self._width)
+        _pad_cells(chars, styles, self._width)
+        self._chars[row] = chars
+        self._styles[row] = styles
+
+    def set_lines(self, lines: Iterable[Union[StyledString, StyledText, str]]):
+        count = 0
+        for row, line in zip(range(self._height), lines):
+            self.set_line(row, line)
+            count += 1
+        for row in range(count, self._height):
+            self._chars[row] = [_BLANK] * self._width
+            self._styles[row] = [_PLAIN] * self._width
+
+    def clear(self):
+        self._chars = [[_BLANK] * self._width for _ in range(self._height)]
+        self._styles = [[_PLAIN] * self._width for _ in range(self._height)]
+
+    def invalidate(self):
+        # the next frame redraws everything, e.g. after the terminal was resized
+        self._clear = True
+
+    def resize(self, width: int, height: int):
+        if width <= 0 or height <= 0:
+            raise ValueError("width and height must be positive")
+        self._width = width
+        self._height = height
+        self.clear()
+        self.invalidate()
+
+    def frame(self, color: Optional[bool] = None) -> str:
+        width = self._width
+        out: list[str] = []
+        shown_chars, shown_styles = self._shown
+        if self._clear:
+            out.append(_CLEAR)
+            blank_chars = [_BLANK] * width
+            blank_styles = [_PLAIN] * width
+            shown_chars = [blank_chars] * self._height
+            shown_styles = [blank_styles] * self._height
+            self._clear = False
+
+        color = _colors_enabled(color)
+        state = _PLAIN
+        for row, (chars, styles) in enumerate(zip(self._chars, self._styles)):
+            old_chars = shown_chars[row]
+            old_styles = shown_styles[row]
+            if chars is old_chars and styles is old_styles:
+                continue
+            if chars == old_chars and styles == old_styles:
+                continue
+
+            cursor = -1
+            for start, end in _changed_runs(
+                chars, styles, old_chars, old_styles, width
+            ):
+                if chars[start] == _WIDE:
+                    start -= 1
+                if start == cursor:
+                    pass
+                elif cursor >= 0:
+                    out.append(f"\033[{start - cursor}C")
+                else:
+                    out.append(f"\033[{row + 1};{start + 1}H")
+
+                for i in range(start, end):
+                    char = chars[i]
+                    if char == _WIDE:
+                        continue
+                    style = styles[i]
+                    if color and style is not state:
+                        sgr = _TRANSITIONS.get((state, style))
+                        out.append(_transition(state, style) if sgr is None else sgr)
+                        state = style
+                    out.append(char)
+
+                cursor = end + 1 if end < width and chars[end] == _WIDE else end
+                if cursor >= width:
+                    # the cursor position after the last column is unreliable
+                    cursor = -1
+
+        if state is not _PLAIN:
+            out.append(_RESET)
+        self._shown = (list(self._chars), list(self._styles))
+        return "".join(out)
+
+    def render_to(
+        self,
+        stream: Union[TextIO, BinaryIO],
+        encoding: str = "utf-8",
+        color: Optional[bool] = None,
+    ):
+        data = self.frame(_colors_enabled(color, stream))
+        if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+            stream.write(data.encode(encoding))
+        else:
+            stream.write(data)
+
+
+def _changed_runs(
+    chars: list[str],
+    styles: list[Style],
+    old_chars: list[str],
+    old_styles: list[Style],
+    width: int,
+) -> list[tuple[int, int]]:
+    runs: list[tuple[int, int]] = []
+    start = end = -1
+    for i in range(width):
+        if chars[i] != old_chars[i] or styles[i] is not old_styles[i]:
+            if start < 0:
+                start = i
+            elif i - end > _MAX_GAP:
+                runs.append((start, end))
+                start = i
+            end = i + 1
+    if start >= 0:
+        runs.append((start, end))
+    return runs
@@ -0,0 +1,162 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import sys
+from array import array
+from typing import Union
+
+from .attributes import Color, Modifier, Style
+from .styled import StyledString, StyledText
+
+# Layout, all integers little-endian:
+#   header     magic, number of styles, number of parts, and the byte size of
+#              each style id and each length
+#   styles     foreground, background, modifiers; colors are 1 + their index
+#              in Color (0 for none), modifiers are packed 4 bits each in order
+#   style ids  one unsigned integer per part, indexing the style table
+#   lengths    one unsigned integer per part, in code points
+#   text       the concatenated text of all parts, UTF-8
+_MAGIC = b"TNT1"
+_HEADER = struct.Struct("<4sIIBB")
+_STYLE = struct.Struct("<BBI")
+_COLORS = (None, *Color)
+_COLOR_CODES = {color: i for i, color in enumerate(_COLORS)}
+_MODIFIERS = {m.value: m for m in Modifier}
+_SWAP = sys.byteorder != "little"
+_TYPECODES = {1: "B", 2: "H", 4: "I"}
+
+_encoded: dict[Style, bytes] = {}
+_decoded: dict[bytes, Style] = {}
+
+
+def _encode_style(style: Style) -> bytes:
+    packed = 0
+    for modifier in reversed(style.modifiers):
+        packed = packed << 4 | modifier.value
+    data = _STYLE.pack(
+        _COLOR_CODES[style.foreground], _COLOR_CODES[style.background], packed
+    )
+    _encoded[style] = data
+    return data
+
+
+def _decode_style(data: bytes) -> Style:
+    foreground, background, packed = _STYLE.unpack(data)
+    modifiers = []
+    while packed:
+        modifiers.append(_MODIFIERS[packed & 15])
+        packed >>= 4
+    style = Style(_COLORS[foreground], _COLORS[background], modifiers)
+    _decoded[data] = style
+    return style
+
+
+def _packed(values: list[int]) -> array:
+    # the smallest unsigned type that holds every value
+    largest = max(values, default=0)
+    typecode = "B" if largest < 1 << 8 else "H" if largest < 1 << 16 else "I"
+    packed = array(typecode, values)
+    if _SWAP:
+        packed.byteswap()
+    return packed
+
+
+def _unpacked(view: memoryview, itemsize: int) -> Union[memoryview, array]:
+    typecode = _TYPECODES[itemsize]
+    if not _SWAP:
+        return view.cast(typecode)
+    values = array(typecode, view)
+    values.byteswap()
+    return values
+
+
+def dumps(value: Union[StyledString, StyledText]) -> bytes:
+    parts = value.parts if isinstance(value, StyledText) else (value,)
+    ids: dict[Style, int] = {}
+    style_ids: list[int] = []
+    lengths: list[int] = []
+    for part in parts:
+        style = part._compiled
+        i = ids.get(style)
+        if i is None:
+            i = ids[style] = len(ids)
+        style_ids.append(i)
+        lengths.append(len(part._text))
+    packed_ids = _packed(style_ids)
+    packed_lengths = _packed(lengths)
+
+    return b"".join(
+        (
+            _HEADER.pack(
+                _MAGIC,
+                len(ids),
+                len(parts),
+                packed_ids.itemsize,
+                packed_lengths.itemsize,
+            ),
+            *[_encoded.get(style) or _encode_style(style) for style in ids],
+            packed_ids.tobytes(),
+            packed_lengths.tobytes(),
+            "".join([part._text for part in parts]).encode("utf-8", "surrogatepass"),
+        )
+    )
+
+
+def loads(data: Union[bytes, bytearray, memoryview]) -> StyledText:
+    # reads straight from the buffer; only the text is copied, once, when it
+    # is decoded
+    view = memoryview(data).cast("B")
+    if len(view) < _HEADER.size:
+        raise ValueError("data is not a serialized StyledText")
+    magic, style_count, part_count, id_size, length_size = _HEADER.unpack_from(view)
+    if magic != _MAGIC or id_size not in _TYPECODES or length_size not in _TYPECODES:
+        raise ValueError("data is not a serialized StyledText")
+    tables = style_count * _STYLE.size + part_count * (id_size + length_size)
+    if len(view) < _HEADER.size + tables:
+        raise ValueError("data is not a serialized StyledText")
+
+    offset = _HEADER.size
+    styles: list[Style] = []
+    try:
+        for _ in range(style_count):
+            entry = bytes(view[offset : offset + _STYLE.size])
+            styles.append(_decoded.get(entry) or _decode_style(entry))
+            offset += _STYLE.size
+    except (IndexError, KeyError):
+        # unknown color or modifier codes
+        raise ValueError("data is not a serialized StyledText") from None
+
+    size = id_size * part_count
+    style_ids = _unpacked(view[offset : offset + size], id_size)
+    offset += size
+    size = length_size * part_count
+    lengths = _unpacked(view[offset : offset + size], length_size)
+    text = str(view[offset + size :], "utf-8", "surrogatepass")
+
+    # every part is derived from one template per style
+    templates = [StyledString("", style) for style in styles]
+    parts: list[StyledString] = []
+    start = 0
+    try:
+        for i, length in zip(style_ids, lengths):
+            end = start + length
+            parts.append(templates[i]._derive(text[start:end]))
+            start = end
+    except IndexError:
+        # a style id outside the style table
+        raise ValueError("data is not a serialized StyledText") from None
+    if start != len(text):
+        raise ValueError("serialized StyledText is corrupt")
+    return StyledText(parts)
@@ -14,18 +14,58 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from operator import index as as_index
 from types import MappingProxyType
 from typing import Any, Iterable, Mapping, Sequence
 
-from .attributes import StyleKey
+from .attributes import Style, StyleKey
+from .width import _covering_length, _fitting_length, display_width
+
+_PLAIN = Style()
+
+
+@lru_cache(maxsize=256)
+def _fill(fillchar: str, count: int) -> StyledString:
+    return StyledString(fillchar * count)
+
+
+def _pad(
+    value: StyledString | StyledText, width: int, fillchar: str, align: str
+) -> StyledText:
+    if len(fillchar) != 1:
+        raise TypeError("The fill character must be exactly one character long")
+
+    parts = value.parts if isinstance(value, StyledText) else (value,)
+    missing = width - value.display_width()
+    if missing <= 0:
+        return value if isinstance(value, StyledText) else StyledText(parts)
+
+    left = 0 if align == "<" else missing if align == ">" else missing // 2
+    right = missing - left
+    if not left:
+        return StyledText((*parts, _fill(fillchar, right)))
+    if not right:
+        return StyledText((_fill(fillchar, left), *parts))
+    return StyledText((_fill(fillchar, left), *parts, _fill(fillchar, right)))
 
 
 class StyledString:
-    __slots__ = ("_text", "_style")
+    __slots__ = ("_text", "_style", "_compiled", "_width")
 
-    def __init__(self, text: str, style: dict[StyleKey, Any] | None = None):
+    def __init__(self, text: str, style: dict[StyleKey, Any] | Style | None = None):
         self._text = str(text)
-        self._style = MappingProxyType(dict(style) if style else {})
+        self._width: int | None = None
+        if isinstance(style, Style):
+            # already immutable and interned: share it instead of copying
+            self._style = self._compiled = style
+        elif style:
+            self._style = MappingProxyType(dict(style))
+            self._compiled = Style.from_mapping(self._style)
+        else:
+            self._style = self._compiled = _PLAIN
 
     @property
     def text(self) -> str:
@@ -35,12 +75,57 @@ class StyledString:
     def style(self) -> Mapping[StyleKey, Any]:
         return self._style
 
+    @property
+    def compiled_style(self) -> Style:
+        return self._compiled
+
+    def _derive(self, text: str) -> StyledString:
+        # same style, new text: shares the style objects instead of copying them
+        derived = StyledString.__new__(StyledString)
+        derived._text = text
+        derived._style = self._style
+        derived._compiled = self._compiled
+        derived._width = None
+        return derived
+
     def __len__(self) -> int:
         return len(self._text)
 
+    def display_width(self) -> int:
+        if self._width is None:
+            self._width = display_width(self._text)
+        return self._width
+
+    def ljust(self, width: int, fillchar: str = " ") -> StyledText:
+        return _pad(self, width, fillchar, "<")
+
+    def rjust(self, width: int, fillchar: str = " ") -> StyledText:
+        return _pad(self, width, fillchar, ">")
+
+    def center(self, width: int, fillchar: str = " ") -> StyledText:
+        return _pad(self, width, fillchar, "^")
+
+    def truncate(
+        self,
+        width: int,
+        ellipsis: str | StyledString = "\u2026",
+        side: str = "end",
+    ) -> StyledText:
+        return StyledText((self,)).truncate(width, ellipsis, side)
+
+    def __getitem__(self, key: int | slice) -> StyledString:
+        text = self._text[key]
+        if text is self._text:
+            return self
+        return self._derive(text)
+
     def __str__(self) -> str:
         return self._text
 
+    def __reduce__(self) -> tuple:
+        # the interned Style pickles as its attributes
+        return (StyledString, (self._text, self._compiled))
+
     def __add__(self, other: object) -> StyledText:
         from .styled import StyledText
 
@@ -53,36 +138,208 @@ class StyledString:
 
 
 class StyledText:
-    __slots__ = ("_parts",)
+    # Concatenation builds a rope: a node keeps references to its two operands
+    # in _children and the flat _parts tuple is only materialised on demand.
+    __slots__ = (
+        "_parts",
+        "_children",
+        "_length",
+        "_offsets",
+        "_width",
+        "_width_offsets",
+    )
 
     def __init__(self, parts: Iterable[StyledString]):
-        self._parts = tuple(parts)
+        self._parts: tuple[StyledString, ...] | None = tuple(parts)
+        self._children: tuple[StyledString | StyledText, ...] | None = None
+        self._length: int | None = None
+        self._offsets: tuple[int, ...] | None = None
+        self._width: int | None = None
+        self._width_offsets: tuple[int, ...] | None = None
+
+    @classmethod
+    def _concat(
+        cls, left: StyledString | StyledText, right: StyledString | StyledText
+    ) -> StyledText:
+        text = cls.__new__(cls)
+        text._parts = None
+        text._children = (left, right)
+        text._length = len(left) + len(right)
+        text._offsets = None
+        text._width = None
+        text._width_offsets = None
+        return text
+
+    @classmethod
+    def from_ansi(cls, text: str) -> StyledText:
+        from .ansi import parse_ansi
+
+        return parse_ansi(text)
 
     @staticmethod
     def _from_parts(left: object, right: object) -> StyledText:
+        def node(value: object) -> StyledString | StyledText:
+            if isinstance(value, (StyledText, StyledString)):
+                return value
+            return StyledString(str(value))
+
+        return StyledText._concat(node(left), node(right))
+
+    def _flatten(self) -> tuple[StyledString, ...]:
         parts: list[StyledString] = []
+        stack: list[StyledString | StyledText] = [self]
 
-        def add(value: object):
-            if isinstance(value, StyledText):
-                parts.extend(value._parts)  # safe: tuple
-            elif isinstance(value, StyledString):
-                parts.append(value)
+        # iterative on purpose: `text += part` in a loop builds a very deep tree
+        while stack:
+            node = stack.pop()
+            if isinstance(node, StyledString):
+                parts.append(node)
+                continue
+            # another thread may be flattening this node: it sets _parts
+            # before clearing _children, so read them in the opposite order
+            children = node._children
+            flat = node._parts
+            if flat is not None:
+                parts.extend(flat)
             else:
-                parts.append(StyledString(str(value)))
+                stack.extend(reversed(children))
 
-        add(left)
-        add(right)
-        return StyledText(parts)
+        return tuple(parts)
 
     @property
     def parts(self) -> Sequence[StyledString]:
-        return self._parts
+        parts = self._parts
+        if parts is None:
+            parts = self._parts = self._flatten()
+            self._children = None
+        return parts
+
+    def _part_offsets(self) -> tuple[int, ...]:
+        # start offset of every part, built once since the text is immutable
+        if self._offsets is None:
+            parts = self.parts
+            self._offsets = (
+                (0, *accumulate(len(p) for p in parts[:-1])) if parts else ()
+            )
+        return self._offsets
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        # (part index, offset inside that part) of the character at index
+        offsets = self._part_offsets()
+        part = bisect_right(offsets, index) - 1
+        return part, index - offsets[part]
 
     def __len__(self) -> int:
-        return sum(len(p) for p in self._parts)
+        if self._length is None:
+            self._length = sum(len(p) for p in self.parts)
+        return self._length
+
+    def display_width(self) -> int:
+        if self._width is None:
+            self._width = sum(p.display_width() for p in self.parts)
+        return self._width
+
+    def _part_width_offsets(self) -> tuple[int, ...]:
+        # display column at which every part starts
+        if self._width_offsets is None:
+            parts = self.parts
+            self._width_offsets = (
+                (0, *accumulate(p.display_width() for p in parts[:-1])) if parts else ()
+            )
+        return self._width_offsets
+
+    def _fitting_length(self, width: int) -> int:
+        # length of the longest prefix that fits in width columns
+        starts = self._part_width_offsets()
+        if not starts:
+            return 0
+        part = bisect_right(starts, width) - 1
+        text = self.parts[part]._text
+        return self._part_offsets()[part] + _fitting_length(text, width - starts[part])
+
+    def _covering_length(self, width: int) -> int:
+        # length of the shortest prefix that is at least width columns wide
+        starts = self._part_width_offsets()
+        if not starts or width <= 0:
+            return 0
+        part = bisect_right(starts, width - 1) - 1
+        text = self.parts[part]._text
+        return self._part_offsets()[part] + _covering_length(text, width - starts[part])
+
+    def ljust(self, width: int, fillchar: str = " ") -> StyledText:
+        return _pad(self, width, fillchar, "<")
+
+    def rjust(self, width: int, fillchar: str = " ") -> StyledText:
+        return _pad(self, width, fillchar, ">")
+
+    def center(self, width: int, fillchar: str = " ") -> StyledText:
+        return _pad(self, width, fillchar, "^")
+
+    def truncate(
+        self,
+        width: int,
+        ellipsis: str | StyledString = "\u2026",
+        side: str = "end",
+    ) -> StyledText:
+        if side not in ("end", "middle"):
+            raise ValueError("side must be 'end' or 'middle'")
+        if width < 0:
+            raise ValueError("width must not be negative")
+        if self.display_width() <= width:
+            return self
+
+        if not isinstance(ellipsis, StyledString):
+            ellipsis = _fill(ellipsis, 1)
+        room = width - ellipsis.display_width()
+        if room < 0:
+            return self[: self._fitting_length(width)]
+
+        if side == "end":
+            head = self[: self._fitting_length(room)]
+            return StyledText((*head.parts, ellipsis))
+
+        head = self[: self._fitting_length((room + 1) // 2)]
+        # columns the head could not use (wide characters) go to the tail
+        tail_width = room - head.display_width()
+        tail_start = self._covering_length(self.display_width() - tail_width)
+        tail = self[tail_start:]
+        return StyledText((*head.parts, ellipsis, *tail.parts))
+
+    def __getitem__(self, key: int | slice) -> StyledString | StyledText:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return StyledText([self[i] for i in range(start, stop, step)])
+            return self._slice(start, stop)
+
+        key = as_index(key)
+        length = len(self)
+        if key < 0:
+            key += length
+        if not 0 <= key < length:
+            raise IndexError("StyledText index out of range")
+        part, offset = self._locate(key)
+        return self.parts[part][offset]
+
+    def _slice(self, start: int, stop: int) -> StyledText:
+        if start >= stop:
+            return StyledText(())
+
+        parts = self.parts
+        first, first_offset = self._locate(start)
+        last, last_offset = self._locate(stop - 1)
+        if first == last:
+            return StyledText((parts[first][first_offset : last_offset + 1],))
+        return StyledText(
+            (
+                parts[first][first_offset:],
+                *parts[first + 1 : last],
+                parts[last][: last_offset + 1],
+            )
+        )
 
     def __iter__(self):
-        return iter(self._parts)
+        return iter(self.parts)
 
     def __add__(self, other: object) -> StyledText:
         return StyledText._from_parts(self, other)
@@ -91,4 +348,37 @@ class StyledText:
         return StyledText._from_parts(other, self)
 
     def __str__(self) -> str:
-        return "".join(p.text for p in self._parts)
+        return "".join(p.text for p in self.parts)
+
+    def __reduce__(self) -> tuple:
+        from .serialize import dumps, loads
+
+        return (loads, (dumps(self),))
+
+
+class StyledTextBuilder:
+    __slots__ = ("_parts",)
+
+    def __init__(self):
+        self._parts: list[StyledString] = []
+
+    def append(self, value: object):
+        if isinstance(value, StyledString):
+            self._parts.append(value)
+        elif isinstance(value, StyledText):
+            self._parts.extend(value.parts)
+        else:
+            self._parts.append(StyledString(str(value)))
+
+    def append_plain(self, text: str):
+        self._parts.append(StyledString(text))
+
+    def extend(self, values: Iterable[object]):
+        for value in values:
+            self.append(value)
+
+    def __len__(self) -> int:
+        return len(self._parts)
+
+    def build(self) -> StyledText:
+        return StyledText(self._parts)
@@ -0,0 +1,188 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import io
+from dataclasses import dataclass, replace
+from itertools import chain, islice
+from typing import Any, BinaryIO, Iterable, Iterator, Optional, Sequence, TextIO, Union
+
+from .attributes import Style
+from .render import _CHUNK_SIZE, _RESET, _colors_enabled, render
+from .styled import StyledString, StyledText
+from .width import display_width
+
+_ALIGNMENTS = ("<", ">", "^")
+# what cells wider than their column are cut down with
+_OVERFLOWS = {"ellipsis": "\u2026", "clip": ""}
+
+
+@dataclass(frozen=True)
+class Column:
+    width: Optional[int] = None
+    align: str = "<"
+    style: Optional[Style] = None
+    overflow: str = "ellipsis"
+
+    def __post_init__(self):
+        if self.align not in _ALIGNMENTS:
+            raise ValueError(f"align must be one of {', '.join(_ALIGNMENTS)}")
+        if self.overflow not in _OVERFLOWS:
+            raise ValueError(f"overflow must be one of {', '.join(_OVERFLOWS)}")
+        if self.width is not None and self.width < 0:
+            raise ValueError("width must not be negative")
+
+
+class Table:
+    # Rows are rendered one at a time. Columns without a fixed width are sized
+    # from the first sample_size rows, so only that sample is held in memory.
+    def __init__(
+        self,
+        columns: Optional[Sequence[Column]] = None,
+        separator: str = " ",
+        sample_size: int = 1000,
+    ):
+        if sample_size < 0:
+            raise ValueError("sample_size must not be negative")
+        self._columns = tuple(columns) if columns is not None else None
+        self._separator = separator
+        self._sample_size = sample_size
+        self._padding: dict[int, str] = {}
+
+    def _pad(self, count: int) -> str:
+        padding = self._padding.get(count)
+        if padding is None:
+            padding = self._padding[count] = " " * count
+        return padding
+
+    def _layout(self, sample: list[Sequence[Any]]) -> tuple[Column, ...]:
+        columns = self._columns
+        if columns is None:
+            columns = (Column(),) * max((len(row) for row in sample), default=0)
+        if all(c.width is not None for c in columns):
+            return columns
+
+        widths = [0] * len(columns)
+        for row in sample:
+            for i, cell in enumerate(row[: len(columns)]):
+                width = _cell_width(cell)
+                if width > widths[i]:
+                    widths[i] = width
+        return tuple(
+            c if c.width is not None else replace(c, width=w)
+            for c, w in zip(columns, widths)
+        )
+
+    def render_iter(
+        self, rows: Iterable[Sequence[Any]], color: Optional[bool] = None
+    ) -> Iterator[str]:
+        rows = iter(rows)
+        sample: list[Sequence[Any]] = []
+        if self._columns is None or any(c.width is None for c in self._columns):
+            sample = list(islice(rows, self._sample_size))
+        columns = self._layout(sample)
+
+        color = _colors_enabled(color)
+        prefixes = [c.style.prefix if color and c.style else "" for c in columns]
+        last = len(columns) - 1
+        separator = self._separator
+        pad = self._pad
+
+        for row in chain(sample, rows):
+            cells: list[str] = []
+            # no trailing blanks after the final cell of a row
+            final = len(row) - 1
+            for i, cell in enumerate(row):
+                text, width = _render_cell(
+                    cell, prefixes[i] if i <= last else "", color
+                )
+                if i > last:
+                    cells.append(text)
+                    continue
+
+                column = columns[i]
+                if width > column.width:
+                    # rows after the sample can be wider than their column
+                    text, width = _render_cell(
+                        _clip(cell, column.width, _OVERFLOWS[column.overflow]),
+                        prefixes[i],
+                        color,
+                    )
+                missing = column.width - width
+                if missing <= 0:
+                    cells.append(text)
+                elif column.align == "<":
+                    cells.append(text if i == final else text + pad(missing))
+                elif column.align == ">":
+                    cells.append(pad(missing) + text)
+                else:
+                    left = missing // 2
+                    right = 0 if i == final else missing - left
+                    cells.append(pad(left) + text + pad(right))
+
+            yield separator.join(cells)
+
+    def render_to(
+        self,
+        rows: Iterable[Sequence[Any]],
+        stream: Union[TextIO, BinaryIO],
+        chunk_size: int = _CHUNK_SIZE,
+        encoding: str = "utf-8",
+        color: Optional[bool] = None,
+    ):
+        binary = isinstance(stream, (io.RawIOBase, io.BufferedIOBase))
+        batch: list[str] = []
+        size = 0
+
+        color = _colors_enabled(color, stream)
+        for line in self.render_iter(rows, color):
+            batch.append(line)
+            batch.append("\n")
+            size += len(line) + 1
+            if size >= chunk_size:
+                data = "".join(batch)
+                stream.write(data.encode(encoding) if binary else data)
+                batch.clear()
+                size = 0
+
+        if batch:
+            data = "".join(batch)
+            stream.write(data.encode(encoding) if binary else data)
+
+
+def _cell_width(cell: Any) -> int:
+    if isinstance(cell, (StyledString, StyledText)):
+        return cell.display_width()
+    return display_width(str(cell))
+
+
+def _clip(cell: Any, width: int, ellipsis: str) -> Any:
+    if isinstance(cell, (StyledString, StyledText)):
+        return cell.truncate(width, ellipsis)
+    # plain cells stay plain, so they keep the column style
+    return str(StyledString(str(cell)).truncate(width, ellipsis))
+
+
+def _render_cell(cell: Any, column_prefix: str, color: bool) -> tuple[str, int]:
+    if isinstance(cell, StyledString):
+        prefix = cell._compiled._prefix if color else ""
+        text = cell._text
+        rendered = prefix + text + _RESET if prefix else text
+        return rendered, cell.display_width()
+    if isinstance(cell, StyledText):
+        return render(cell, color=color), cell.display_width()
+
+    text = str(cell)
+    rendered = column_prefix + text + _RESET if column_prefix else text
+    return rendered, display_width(text)
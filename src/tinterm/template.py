@@ -0,0 +1,169 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from string import Formatter
+from typing import Any, Mapping, Optional, Sequence, Union
+
+from .attributes import Style
+from .render import _RESET, _colors_enabled, render
+from .styled import StyledString, StyledText
+
+_FORMATTER = Formatter()
+# the argument a field refers to, before any attribute or index lookup
+_ARGUMENT = re.compile(r"[^.\[]*")
+
+
+def _escape(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+class _Rendered:
+    # A styled value inside str.format(): alignment and width in the format
+    # spec are applied to the plain text, then the styled text is put back.
+    # str.format() fills the slots from left to right, so the n-th call to
+    # __format__ is for the n-th slot of the value, styled by prefixes[n].
+    __slots__ = ("_rendered", "_plain", "_prefixes", "_next")
+
+    def __init__(
+        self, value: Union[StyledString, StyledText], prefixes: Sequence[str] = ()
+    ):
+        # only used when colors are enabled
+        self._rendered = render(value, color=True)
+        self._plain = str(value)
+        self._prefixes = prefixes
+        self._next = 0
+
+    def __format__(self, spec: str) -> str:
+        rendered = self._rendered
+        prefix = ""
+        if self._next < len(self._prefixes):
+            prefix = self._prefixes[self._next]
+            self._next += 1
+        if prefix and _RESET in rendered:
+            # each reset in the value also ends the style of its slot
+            rendered = rendered.replace(_RESET, _RESET + prefix)
+
+        formatted = format(self._plain, spec) if spec else self._plain
+        start = formatted.find(self._plain)
+        if start < 0:
+            # cut by a precision: the styles no longer match the text
+            return formatted
+        end = start + len(self._plain)
+        if end == len(formatted) and prefix and rendered.endswith(_RESET + prefix):
+            # the slot's own reset follows
+            rendered = rendered[: -len(prefix)]
+        return formatted[:start] + rendered + formatted[end:]
+
+    def __str__(self) -> str:
+        return self._rendered
+
+    def __repr__(self) -> str:
+        return repr(self._plain)
+
+
+class Template:
+    # Compiled once into two str.format() patterns, with and without escape
+    # codes, in which every fixed fragment is already rendered. Formatting is
+    # a single str.format() call on the matching pattern.
+    __slots__ = ("_colored", "_plain", "_slots")
+
+    def __init__(
+        self,
+        pattern: Union[str, StyledString, StyledText],
+        styles: Optional[Mapping[str, Union[Style, Mapping]]] = None,
+    ):
+        if isinstance(pattern, StyledText):
+            parts = pattern.parts
+        elif isinstance(pattern, StyledString):
+            parts = (pattern,)
+        else:
+            parts = (StyledString(pattern),)
+        slot_styles = {
+            name: s if isinstance(s, Style) else Style.from_mapping(s)
+            for name, s in (styles or {}).items()
+        }
+
+        colored: list[str] = []
+        plain: list[str] = []
+        # the prefixes of the slots of each argument, in order
+        slots: dict[Union[int, str], list[str]] = {}
+        automatic = 0
+        for part in parts:
+            part_prefix = part._compiled._prefix
+            for literal, field, spec, conversion in _FORMATTER.parse(part._text):
+                if literal:
+                    text = _escape(literal)
+                    plain.append(text)
+                    colored.append(part_prefix + text + _RESET if part_prefix else text)
+                if field is None:
+                    continue
+
+                slot = "{" + field
+                if conversion:
+                    slot += "!" + conversion
+                if spec:
+                    slot += ":" + spec
+                slot += "}"
+                plain.append(slot)
+                # slots take the style of their fragment unless given their own
+                style = slot_styles.get(field)
+                prefix = style._prefix if style is not None else part_prefix
+                colored.append(prefix + slot + _RESET if prefix else slot)
+
+                argument = _ARGUMENT.match(field).group()
+                key: Union[int, str] = argument
+                if not argument:
+                    key = automatic
+                    automatic += 1
+                elif argument.isdigit():
+                    key = int(argument)
+                # only these slots format the argument itself
+                if argument == field and not conversion:
+                    slots.setdefault(key, []).append(prefix)
+
+        self._colored = "".join(colored)
+        self._plain = "".join(plain)
+        self._slots = {key: tuple(prefixes) for key, prefixes in slots.items()}
+
+    def format(self, *args: Any, **kwargs: Any) -> str:
+        if not _colors_enabled():
+            # styled values as their plain text, so format specs apply
+            if any(isinstance(v, (StyledString, StyledText)) for v in args):
+                args = tuple(
+                    str(v) if isinstance(v, (StyledString, StyledText)) else v
+                    for v in args
+                )
+            for name, value in kwargs.items():
+                if isinstance(value, (StyledString, StyledText)):
+                    kwargs[name] = str(value)
+            return self._plain.format(*args, **kwargs)
+        # styled values are rendered, on top of the style of their slot
+        slots = self._slots
+        if any(isinstance(v, (StyledString, StyledText)) for v in args):
+            args = tuple(
+                (
+                    _Rendered(v, slots.get(i, ()))
+                    if isinstance(v, (StyledString, StyledText))
+                    else v
+                )
+                for i, v in enumerate(args)
+            )
+        for name, value in kwargs.items():
+            if isinstance(value, (StyledString, StyledText)):
+                kwargs[name] = _Rendered(value, slots.get(name, ()))
+        return self._colored.format(*args, **kwargs)
+
+    def format_map(self, values: Mapping[str, Any]) -> str:
+        return self.format(**values)
@@ -0,0 +1,81 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+from dataclasses import dataclass
+from typing import Any, Optional
+
+_TRUE_COLOR = 1 << 24
+# FORCE_COLOR levels as used by many command line tools
+_FORCE_LEVELS = {"0": 0, "false": 0, "1": 16, "true": 16, "2": 256, "3": _TRUE_COLOR}
+
+
+@dataclass(frozen=True)
+class Capabilities:
+    tty: bool
+    # number of colors the terminal can show: 0, 16, 256 or 2**24
+    colors: int
+
+    @property
+    def color(self) -> bool:
+        return self.colors > 0
+
+
+# detected once per file descriptor; None for streams without one
+_cache: dict[Optional[int], Capabilities] = {}
+
+
+def _fileno(stream: Any) -> Optional[int]:
+    try:
+        return stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _depth() -> int:
+    if os.environ.get("COLORTERM", "").lower() in ("truecolor", "24bit"):
+        return _TRUE_COLOR
+    if "256" in os.environ.get("TERM", ""):
+        return 256
+    return 16
+
+
+def _detect(fd: Optional[int]) -> Capabilities:
+    tty = fd is not None and os.isatty(fd)
+    environ = os.environ
+
+    force = environ.get("FORCE_COLOR")
+    if force:
+        level = _FORCE_LEVELS.get(force.lower(), 16)
+        return Capabilities(tty, max(level, _depth()) if level else 0)
+    if environ.get("NO_COLOR"):
+        return Capabilities(tty, 0)
+    if not tty or environ.get("TERM") == "dumb":
+        return Capabilities(tty, 0)
+    return Capabilities(tty, _depth())
+
+
+def detect(stream: Any = None) -> Capabilities:
+    # stream defaults to sys.stdout
+    fd = _fileno(sys.stdout if stream is None else stream)
+    capabilities = _cache.get(fd)
+    if capabilities is None:
+        capabilities = _cache[fd] = _detect(fd)
+    return capabilities
+
+
+def clear_cache():
+    # after the environment changed or a file descriptor was reused
+    _cache.clear()
@@ -0,0 +1,157 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import re
+from typing import Optional, Union
+
+from .styled import StyledString, StyledText, StyledTextBuilder
+from .width import _fitting_length, display_width
+
+_TOKENS = re.compile(r"[^\S\n]+|[^\s]+")
+_NEWLINE = StyledString("\n")
+
+
+def _as_text(value: Union[StyledString, StyledText]) -> StyledText:
+    return value if isinstance(value, StyledText) else StyledText((value,))
+
+
+def _line_ranges(plain: str, start: int, end: int, width: int) -> list[tuple[int, int]]:
+    ranges: list[tuple[int, int]] = []
+    line_start: Optional[int] = None
+    line_end = line_width = gap_width = 0
+
+    for match in _TOKENS.finditer(plain, start, end):
+        token = match.group()
+        token_width = display_width(token)
+        if token[0].isspace():
+            if line_start is not None:
+                gap_width += token_width
+            continue
+
+        token_start, token_end = match.span()
+        if line_start is not None:
+            if line_width + gap_width + token_width <= width:
+                line_end = token_end
+                line_width += gap_width + token_width
+                gap_width = 0
+                continue
+            ranges.append((line_start, line_end))
+
+        # words longer than a whole line are broken up
+        while token_width > width:
+            # at least one character, even if it alone is wider than a line
+            cut = max(_fitting_length(token, width), 1)
+            ranges.append((token_start, token_start + cut))
+            token_start += cut
+            token = token[cut:]
+            token_width = display_width(token)
+
+        line_start, line_end, line_width, gap_width = (
+            token_start,
+            token_end,
+            token_width,
+            0,
+        )
+
+    if line_start is not None:
+        ranges.append((line_start, line_end))
+    if not ranges:
+        ranges.append((start, start))
+    return ranges
+
+
+def wrap(value: Union[StyledString, StyledText], width: int) -> list[StyledText]:
+    if width <= 0:
+        raise ValueError("width must be positive")
+
+    text = _as_text(value)
+    plain = str(text)
+    lines: list[StyledText] = []
+    start = 0
+
+    for paragraph in plain.split("\n"):
+        end = start + len(paragraph)
+        lines.extend(text[a:b] for a, b in _line_ranges(plain, start, end, width))
+        start = end + 1
+
+    return lines
+
+
+def fill(value: Union[StyledString, StyledText], width: int) -> StyledText:
+    builder = StyledTextBuilder()
+    for i, line in enumerate(wrap(value, width)):
+        if i:
+            builder.append(_NEWLINE)
+        builder.append(line)
+    return builder.build()
+
+
+class _Paragraph:
+    __slots__ = ("text", "plain", "width", "single", "wrapped_width", "wrapped")
+
+    def __init__(self, text: StyledText):
+        self.text = text
+        self.plain = str(text)
+        self.width = text.display_width()
+        self.single: Optional[list[StyledText]] = None
+        self.wrapped_width = 0
+        self.wrapped: list[StyledText] = []
+
+    def lines(self, width: int) -> list[StyledText]:
+        if self.width <= width:
+            # a paragraph that fits looks the same at every larger width
+            if self.single is None:
+                self.single = self._wrap(width)
+            return self.single
+        if self.wrapped_width != width:
+            self.wrapped = self._wrap(width)
+            self.wrapped_width = width
+        return self.wrapped
+
+    def _wrap(self, width: int) -> list[StyledText]:
+        text = self.text
+        return [
+            text[a:b] for a, b in _line_ranges(self.plain, 0, len(self.plain), width)
+        ]
+
+
+class Reflow:
+    # Keeps the wrapped lines of every paragraph, so that after a resize only
+    # paragraphs wider than the new width are wrapped again.
+    def __init__(self, value: Union[StyledString, StyledText, None] = None):
+        self._paragraphs: list[_Paragraph] = []
+        if value is not None:
+            self.append(value)
+
+    def append(self, value: Union[StyledString, StyledText]):
+        text = _as_text(value)
+        plain = str(text)
+        start = 0
+        for paragraph in plain.split("\n"):
+            end = start + len(paragraph)
+            self._paragraphs.append(_Paragraph(text[start:end]))
+            start = end + 1
+
+    def __len__(self) -> int:
+        return len(self._paragraphs)
+
+    def lines(self, width: int) -> list[StyledText]:
+        if width <= 0:
+            raise ValueError("width must be positive")
+
+        lines: list[StyledText] = []
+        for paragraph in self._paragraphs:
+            lines.extend(paragraph.lines(width))
+        return lines
@@ -0,0 +1,136 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextvars
+import io
+import sys
+import threading
+from queue import Empty, SimpleQueue
+from time import monotonic
+from typing import BinaryIO, Optional, TextIO, Union
+
+from .render import _colors_enabled, render
+from .styled import StyledString, StyledText
+
+# queue marker for close(); flush() enqueues a threading.Event
+_STOP = object()
+# upper bound on the number of values rendered into one write
+_MAX_BATCH = 4096
+
+
+class BackgroundWriter:
+    # write() only puts the value on a queue. A writer thread renders queued
+    # values in batches and writes each batch with one write() call, waiting
+    # at most flush_interval seconds for more values once one has arrived.
+    def __init__(
+        self,
+        stream: Optional[Union[TextIO, BinaryIO]] = None,
+        flush_interval: float = 0.05,
+        minimal: bool = False,
+        encoding: str = "utf-8",
+        color: Optional[bool] = None,
+    ):
+        if flush_interval < 0:
+            raise ValueError("flush_interval must not be negative")
+        self._stream = stream if stream is not None else sys.stdout
+        self._binary = isinstance(self._stream, (io.RawIOBase, io.BufferedIOBase))
+        self._flush_interval = flush_interval
+        self._minimal = minimal
+        self._encoding = encoding
+        self._color = color
+        self._queue: SimpleQueue = SimpleQueue()
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        # rendering follows the color setting of the creating context
+        context = contextvars.copy_context()
+        self._thread = threading.Thread(
+            target=context.run, args=(self._run,), name="tinterm-writer", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, value: Union[StyledString, StyledText, str]):
+        if self._closed:
+            raise ValueError("write to closed BackgroundWriter")
+        self._queue.put(value)
+
+    def flush(self):
+        # blocks until everything written before the call is on the stream
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+        self._raise_error()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._raise_error()
+
+    def _raise_error(self):
+        error = self._error
+        if error is not None:
+            self._error = None
+            raise error
+
+    def _run(self):
+        queue = self._queue
+        running = True
+        while running:
+            batch = [queue.get()]
+            deadline = monotonic() + self._flush_interval
+            while len(batch) < _MAX_BATCH and batch[-1] is not _STOP:
+                if isinstance(batch[-1], threading.Event):
+                    # flush() is waiting, so write without delay
+                    deadline = 0.0
+                try:
+                    timeout = deadline - monotonic()
+                    batch.append(
+                        queue.get(timeout=timeout)
+                        if timeout > 0
+                        else queue.get_nowait()
+                    )
+                except Empty:
+                    break
+
+            # _STOP can only be the last value of a batch
+            running = batch[-1] is not _STOP
+            events = [v for v in batch if isinstance(v, threading.Event)]
+            try:
+                color = _colors_enabled(self._color, self._stream)
+                texts = [
+                    v if isinstance(v, str) else render(v, self._minimal, color)
+                    for v in batch
+                    if v is not _STOP and not isinstance(v, threading.Event)
+                ]
+                if texts:
+                    data = "".join(texts)
+                    stream = self._stream
+                    stream.write(data.encode(self._encoding) if self._binary else data)
+                    stream.flush()
+            except Exception as error:
+                # reported to the next flush() or close(); the batch is lost
+                if self._error is None:
+                    self._error = error
+            for event in events:
+                event.set()
+
+    def __enter__(self) -> "BackgroundWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
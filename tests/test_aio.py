@@ -0,0 +1,143 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import os
+import threading
+
+import pytest
+
+from tinterm.aio import AsyncWriter
+from tinterm.attributes import Color, Style, StyleKey
+from tinterm.render import enable_colors, render
+from tinterm.styled import StyledString, StyledText
+
+
+class BufferWriter:
+    """Minimal stand-in for asyncio.StreamWriter."""
+
+    def __init__(self):
+        self.chunks = []
+        self.drains = 0
+        self.closed = False
+
+    def get_extra_info(self, name, default=None):
+        return default
+
+    def write(self, data):
+        self.chunks.append(data)
+
+    async def drain(self):
+        self.drains += 1
+
+    def close(self):
+        self.closed = True
+
+    async def wait_closed(self):
+        pass
+
+
+class TestAsyncWriter:
+    """Tests for the asyncio writer."""
+
+    def setup_method(self):
+        enable_colors()
+
+    def teardown_method(self):
+        enable_colors()
+
+    def test_invalid_chunk_size(self):
+        """Test that the chunk size must be positive."""
+        with pytest.raises(ValueError):
+            AsyncWriter(BufferWriter(), chunk_size=0)
+
+    def test_write_in_chunks(self):
+        """Test that values are written in drained chunks of bounded size."""
+        red = {StyleKey.FOREGROUND: Color.RED}
+        value = StyledText([StyledString(f"line {i}\n", style=red) for i in range(100)])
+        buffer = BufferWriter()
+
+        async def main():
+            async with AsyncWriter(buffer, chunk_size=64) as writer:
+                await writer.write(value)
+
+        asyncio.run(main())
+        assert b"".join(buffer.chunks) == render(value).encode()
+        assert all(len(chunk) <= 64 for chunk in buffer.chunks)
+        assert buffer.drains == len(buffer.chunks) > 1
+        assert buffer.closed
+
+    def test_other_tasks_run_between_chunks(self):
+        """Test that a large write yields to the event loop."""
+        buffer = BufferWriter()
+        ticks = []
+
+        async def ticker():
+            for _ in range(3):
+                ticks.append(len(buffer.chunks))
+                await asyncio.sleep(0)
+
+        async def main():
+            writer = AsyncWriter(buffer, chunk_size=10)
+            await asyncio.gather(writer.write("x" * 100), ticker())
+
+        asyncio.run(main())
+        # the ticker ran between the first chunks of the write
+        assert ticks == [1, 2, 3]
+
+    def test_rope_is_flattened_off_the_loop(self, monkeypatch):
+        """Test that a text built by many concatenations is flattened in a worker."""
+        value = StyledText([])
+        for i in range(200):
+            value += StyledString(
+                str(i % 10), style=Style(Color.RED) if i % 2 else None
+            )
+        threads = []
+        flatten = StyledText._flatten
+
+        def recording(self):
+            threads.append(threading.current_thread())
+            return flatten(self)
+
+        monkeypatch.setattr(StyledText, "_flatten", recording)
+        buffer = BufferWriter()
+        asyncio.run(AsyncWriter(buffer, chunk_size=64).write(value))
+        assert b"".join(buffer.chunks) == render(value).encode()
+        assert threads and threading.main_thread() not in threads
+
+    def test_plain_strings(self):
+        """Test that plain strings are written unchanged."""
+        buffer = BufferWriter()
+        asyncio.run(AsyncWriter(buffer).write("世界"))
+        assert b"".join(buffer.chunks) == "世界".encode()
+
+    def test_open_fd(self):
+        """Test writing to a pipe file descriptor."""
+        read_fd, write_fd = os.pipe()
+        value = StyledString("hello", style={StyleKey.FOREGROUND: Color.GREEN})
+
+        async def main():
+            writer = await AsyncWriter.open_fd(write_fd, minimal=True)
+            await writer.write(value)
+            await writer.close()
+
+        try:
+            asyncio.run(main())
+            assert os.read(read_fd, 1024) == b"\033[32mhello\033[0m"
+            # the descriptor stays open and usable for blocking writes
+            assert os.get_blocking(write_fd)
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
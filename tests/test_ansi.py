@@ -0,0 +1,191 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from tinterm.ansi import AnsiStripper, parse_ansi, strip_ansi
+from tinterm.attributes import Color, Modifier, Style, StyleKey
+from tinterm.render import enable_colors, render
+from tinterm.styled import StyledString, StyledText
+
+
+class TestFromAnsi:
+    """Tests for StyledText.from_ansi()."""
+
+    def setup_method(self):
+        """Ensure colors are enabled before each test."""
+        enable_colors()
+
+    def test_plain_text(self):
+        """Test that text without escapes becomes one unstyled part."""
+        st = StyledText.from_ansi("hello")
+        assert [p.text for p in st.parts] == ["hello"]
+        assert st.parts[0].style == {}
+
+    def test_empty_text(self):
+        """Test that an empty string yields no parts."""
+        assert StyledText.from_ansi("").parts == ()
+
+    def test_foreground(self):
+        """Test parsing a foreground color."""
+        st = StyledText.from_ansi("\033[31mhello\033[0m")
+        assert len(st.parts) == 1
+        assert st.parts[0].text == "hello"
+        assert st.parts[0].style == {StyleKey.FOREGROUND: Color.RED}
+
+    def test_combined_attributes(self):
+        """Test parsing foreground, background and modifiers together."""
+        st = StyledText.from_ansi("\033[93;44;1;4mhi\033[0m")
+        assert st.parts[0].style is Style(
+            Color.BRIGHT_YELLOW, Color.BLUE, [Modifier.BOLD, Modifier.UNDERLINE]
+        )
+
+    def test_styles_are_interned(self):
+        """Test that parsed parts share interned Style objects."""
+        st = StyledText.from_ansi("\033[32ma\033[0m \033[32mb\033[0m")
+        assert st.parts[0].style is st.parts[2].style
+        assert st.parts[0].style is Style(Color.GREEN)
+
+    def test_partial_changes(self):
+        """Test that later codes only change the given attributes."""
+        st = StyledText.from_ansi("\033[31;44;1ma\033[32mb\033[22mc\033[49md")
+        assert st.parts[0].style is Style(Color.RED, Color.BLUE, [Modifier.BOLD])
+        assert st.parts[1].style is Style(Color.GREEN, Color.BLUE, [Modifier.BOLD])
+        assert st.parts[2].style is Style(Color.GREEN, Color.BLUE)
+        assert st.parts[3].style is Style(Color.GREEN)
+
+    def test_reset(self):
+        """Test that a reset returns to unstyled text."""
+        st = StyledText.from_ansi("\033[31ma\033[0mb\033[1mc\033[mD")
+        assert st.parts[1].style == {}
+        assert st.parts[2].style is Style(modifiers=[Modifier.BOLD])
+        assert st.parts[3].style == {}
+
+    def test_extended_colors_are_skipped(self):
+        """Test that 256-colour and true-colour codes are ignored."""
+        st = StyledText.from_ansi("\033[38;5;208;1ma\033[48;2;1;2;3;4mb")
+        assert st.parts[0].style is Style(modifiers=[Modifier.BOLD])
+        assert st.parts[1].style is Style(modifiers=[Modifier.BOLD, Modifier.UNDERLINE])
+
+    def test_other_sequences_are_dropped(self):
+        """Test that cursor movement and OSC sequences are removed."""
+        st = StyledText.from_ansi("\033[2J\033]0;title\007a\033[1Ab")
+        assert str(st) == "ab"
+
+    def test_round_trip(self):
+        """Test that rendering parsed output reproduces the input."""
+        original = (
+            StyledString("[12:00]", style={StyleKey.FOREGROUND: Color.BRIGHT_BLACK})
+            + " "
+            + StyledString(
+                "ERROR",
+                style={
+                    StyleKey.FOREGROUND: Color.WHITE,
+                    StyleKey.BACKGROUND: Color.RED,
+                    StyleKey.MODIFIERS: [Modifier.BOLD],
+                },
+            )
+            + StyledString("", style={StyleKey.FOREGROUND: Color.RED})
+            + StyledString(" failed", style={StyleKey.FOREGROUND: Color.RED})
+        )
+        rendered = render(original)
+        parsed = StyledText.from_ansi(rendered)
+        assert render(parsed) == rendered
+        assert str(parsed) == str(original)
+
+    def test_round_trip_minimal(self):
+        """Test that minimal output also round-trips."""
+        original = StyledText(
+            StyledString(
+                str(i),
+                style={
+                    StyleKey.FOREGROUND: color,
+                    StyleKey.MODIFIERS: [Modifier.BOLD] if i % 2 else [],
+                },
+            )
+            for i, color in enumerate([Color.RED, Color.RED, Color.BLUE, None])
+        )
+        rendered = render(original, minimal=True)
+        assert render(parse_ansi(rendered), minimal=True) == rendered
+
+
+class TestStripAnsi:
+    """Tests for strip_ansi()."""
+
+    def test_plain_text_is_returned_unchanged(self):
+        """Test that text without escapes is returned as-is."""
+        text = "hello world"
+        assert strip_ansi(text) is text
+
+    def test_strip_sgr(self):
+        """Test that SGR sequences are removed."""
+        assert strip_ansi("\033[31;1mred\033[0m text") == "red text"
+
+    def test_strip_other_csi(self):
+        """Test that cursor and erase sequences are removed."""
+        assert strip_ansi("\033[2J\033[1;1Ha\033[?25lb") == "ab"
+
+    def test_strip_osc(self):
+        """Test that OSC sequences with both terminators are removed."""
+        text = "\033]0;title\007a\033]8;;https://example.com\033\\link"
+        assert strip_ansi(text) == "alink"
+
+    def test_strip_bytes(self):
+        """Test that bytes input is supported."""
+        assert strip_ansi(b"\033[32mok\033[0m") == b"ok"
+        data = b"plain"
+        assert strip_ansi(data) is data
+
+    def test_strip_rendered_output(self):
+        """Test that stripping rendered output yields the plain text."""
+        st = StyledString("a", style={StyleKey.FOREGROUND: Color.RED}) + StyledString(
+            "b", style={StyleKey.MODIFIERS: [Modifier.BOLD]}
+        )
+        assert strip_ansi(render(st)) == str(st)
+
+
+class TestAnsiStripper:
+    """Tests for the streaming AnsiStripper."""
+
+    TEXT = "\033[31mred\033[0m \033]0;title\007x\033]8;;u\033\\y\033[1;38;5;3mz"
+
+    def _feed_in_chunks(self, stripper, data, size):
+        out = [stripper.feed(data[i : i + size]) for i in range(0, len(data), size)]
+        out.append(stripper.flush())
+        return out
+
+    def test_matches_strip_ansi_for_every_split(self):
+        """Test that any chunking gives the same result as strip_ansi."""
+        expected = strip_ansi(self.TEXT)
+        for size in range(1, len(self.TEXT) + 1):
+            out = self._feed_in_chunks(AnsiStripper(), self.TEXT, size)
+            assert "".join(out) == expected
+
+    def test_bytes_chunks(self):
+        """Test streaming bytes input."""
+        data = self.TEXT.encode()
+        out = self._feed_in_chunks(AnsiStripper(), data, 3)
+        assert b"".join(out) == strip_ansi(data)
+
+    def test_split_sequence_is_held_back(self):
+        """Test that an incomplete sequence is not emitted early."""
+        stripper = AnsiStripper()
+        assert stripper.feed("abc\033[3") == "abc"
+        assert stripper.feed("1mdef") == "def"
+
+    def test_flush_passes_unterminated_sequence(self):
+        """Test that an unterminated sequence is returned by flush()."""
+        stripper = AnsiStripper()
+        assert stripper.feed("a\033[") == "a"
+        assert stripper.flush() == "\033["
+        assert stripper.flush() == ""
@@ -12,7 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from tinterm.attributes import AnsiColor, Color, Modifier, StyleKey
+import pickle
+
+import pytest
+
+from tinterm.attributes import AnsiColor, Color, Modifier, Style, StyleKey
 
 
 def test_modifier_bold():
@@ -117,3 +121,70 @@ def test_stylekey_background():
 
 def test_stylekey_modifiers():
     assert StyleKey.MODIFIERS.value == "style_key_modifiers"
+
+
+def test_style_is_interned():
+    a = Style(Color.RED, None, [Modifier.BOLD])
+    b = Style(foreground=Color.RED, modifiers=(Modifier.BOLD,))
+    assert a is b
+    assert hash(a) == hash(b)
+
+
+def test_style_distinct_attributes_are_distinct():
+    assert Style(Color.RED) is not Style(Color.BLUE)
+    assert Style(Color.RED) is not Style(background=Color.RED)
+
+
+def test_style_prefix():
+    assert Style().prefix == ""
+    assert Style(Color.RED).prefix == "\033[31m"
+    assert Style(Color.RED, Color.WHITE, [Modifier.BOLD]).prefix == "\033[31;47;1m"
+
+
+def test_style_prefix_bytes():
+    style = Style(Color.RED, Color.WHITE, [Modifier.BOLD])
+    assert style.prefix_bytes == style.prefix.encode("ascii")
+    assert Style().prefix_bytes == b""
+
+
+def test_style_prefix_keeps_modifier_order():
+    assert Style(modifiers=[Modifier.UNDERLINE, Modifier.BOLD]).prefix == "\033[4;1m"
+
+
+def test_style_ignores_invalid_values():
+    assert Style("red", 3, [Modifier.BOLD, "x"]) is Style(modifiers=[Modifier.BOLD])
+
+
+def test_style_from_mapping():
+    style = Style.from_mapping(
+        {StyleKey.FOREGROUND: Color.GREEN, StyleKey.MODIFIERS: [Modifier.ITALIC]}
+    )
+    assert style is Style(Color.GREEN, modifiers=[Modifier.ITALIC])
+    assert Style.from_mapping(style) is style
+    assert Style.from_mapping({StyleKey.MODIFIERS: None}) is Style()
+
+
+def test_style_is_a_mapping():
+    style = Style(Color.RED, modifiers=[Modifier.BOLD])
+    assert style == {
+        StyleKey.FOREGROUND: Color.RED,
+        StyleKey.MODIFIERS: (Modifier.BOLD,),
+    }
+    assert style[StyleKey.FOREGROUND] == Color.RED
+    assert StyleKey.BACKGROUND not in style
+    assert Style() == {}
+
+
+def test_style_is_immutable():
+    style = Style(Color.RED)
+    with pytest.raises(TypeError):
+        style[StyleKey.FOREGROUND] = Color.BLUE
+    with pytest.raises(AttributeError):
+        style._prefix = ""
+
+
+def test_style_pickles_to_the_interned_instance():
+    style = Style(Color.RED, Color.WHITE, [Modifier.UNDERLINE, Modifier.BOLD])
+    loaded = pickle.loads(pickle.dumps(style))
+    assert loaded is style
+    assert loaded.prefix == "\033[31;47;4;1m"
@@ -0,0 +1,234 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import io
+import threading
+import time
+
+import pytest
+
+from tinterm import live
+from tinterm.attributes import Color, StyleKey
+from tinterm.live import Live, LiveStatus
+from tinterm.render import enable_colors
+from tinterm.styled import StyledString
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+
+class TestLive:
+    """Tests for the Live region."""
+
+    def setup_method(self):
+        enable_colors()
+
+    def teardown_method(self):
+        enable_colors()
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        clock = FakeClock()
+        monkeypatch.setattr(live, "monotonic", clock)
+        return clock
+
+    def test_invalid_refresh_rate(self):
+        """Test that the refresh rate must be positive."""
+        with pytest.raises(ValueError):
+            Live(io.StringIO(), refresh_rate=0)
+
+    def test_first_update_is_drawn(self, clock):
+        """Test that the first update is written immediately."""
+        stream = io.StringIO()
+        Live(stream).update("50%")
+        assert stream.getvalue() == "\033[J50%"
+
+    def test_updates_are_coalesced(self, clock):
+        """Test that updates within one frame interval are dropped."""
+        stream = CountingStream()
+        region = Live(stream, refresh_rate=10)
+        for i in range(1000):
+            region.update(f"{i}")
+        assert stream.writes == 1
+        assert stream.getvalue() == "\033[J0"
+
+        clock.now += 0.1
+        region.update("done")
+        assert stream.writes == 2
+        assert stream.getvalue().endswith("\r\033[Jdone")
+
+    def test_trailing_refresh(self):
+        """Test that an early update is drawn once the interval is over."""
+        stream = io.StringIO()
+        region = Live(stream, refresh_rate=50)
+        region.update("first")
+        region.update("last")
+        assert stream.getvalue() == "\033[Jfirst"
+        deadline = time.monotonic() + 5
+        while "last" not in stream.getvalue() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert stream.getvalue() == "\033[Jfirst\r\033[Jlast"
+        region.close()
+        assert stream.getvalue() == "\033[Jfirst\r\033[Jlast\n"
+
+    def test_close_cancels_trailing_refresh(self, clock):
+        """Test that nothing is drawn after the region is closed."""
+        stream = io.StringIO()
+        region = Live(stream)
+        region.update("a")
+        region.update("b")
+        assert region._timer is not None
+        region.close()
+        assert region._timer is None
+        assert stream.getvalue() == "\033[Ja\r\033[Jb\n"
+
+    def test_multi_line_redraw(self, clock):
+        """Test that redraws move back to the first line of the region."""
+        stream = io.StringIO()
+        region = Live(stream)
+        region.update("a\nb\nc")
+        clock.now += 1
+        region.update("d")
+        assert stream.getvalue() == "\033[Ja\nb\nc\r\033[2A\033[Jd"
+
+    def test_styled_update(self, clock):
+        """Test that styled values are rendered."""
+        stream = io.StringIO()
+        Live(stream).update(
+            StyledString("ok", style={StyleKey.FOREGROUND: Color.GREEN})
+        )
+        assert stream.getvalue() == "\033[J\033[32mok\033[0m"
+
+    def test_close_draws_pending_state(self, clock):
+        """Test that closing draws the last update and ends the line."""
+        stream = io.StringIO()
+        with Live(stream) as region:
+            region.update("1")
+            region.update("2")
+        assert stream.getvalue() == "\033[J1\r\033[J2\n"
+
+    def test_close_without_updates(self, clock):
+        """Test that closing an unused region writes nothing."""
+        stream = io.StringIO()
+        Live(stream).close()
+        assert stream.getvalue() == ""
+
+    def test_binary_stream(self, clock):
+        """Test writing frames to a binary stream."""
+        stream = io.BytesIO()
+        Live(stream).update("世")
+        assert stream.getvalue() == "\033[J世".encode()
+
+
+class TestLiveStatus:
+    """Tests for the multi-line LiveStatus display."""
+
+    def setup_method(self):
+        enable_colors()
+
+    def teardown_method(self):
+        enable_colors()
+
+    def test_invalid_arguments(self):
+        """Test that slot counts and refresh rates must be positive."""
+        with pytest.raises(ValueError):
+            LiveStatus(0, io.StringIO())
+        with pytest.raises(ValueError):
+            LiveStatus(2, io.StringIO(), refresh_rate=-1)
+
+    def test_first_refresh_draws_all_slots(self):
+        """Test that the first frame draws every slot."""
+        stream = io.StringIO()
+        status = LiveStatus(3, stream)
+        status.set(0, "a")
+        status.set(2, "c")
+        status.refresh()
+        assert stream.getvalue() == "a\n\nc"
+        assert len(status) == 3
+
+    def test_only_dirty_slots_are_redrawn(self):
+        """Test that later frames rewrite only the changed slots."""
+        stream = io.StringIO()
+        status = LiveStatus(4, stream)
+        status.refresh()
+        stream.seek(0)
+        stream.truncate()
+
+        status.set(1, StyledString("busy", style={StyleKey.FOREGROUND: Color.RED}))
+        status.refresh()
+        assert stream.getvalue() == ("\r\033[2A\033[31mbusy\033[0m\033[K\r\033[2B")
+
+    def test_unchanged_frame_writes_nothing(self):
+        """Test that no write happens when no slot changed."""
+        stream = CountingStream()
+        status = LiveStatus(2, stream)
+        status.refresh()
+        status.refresh()
+        assert stream.writes == 1
+
+    def test_last_slot(self):
+        """Test redrawing the slot the cursor rests on."""
+        stream = io.StringIO()
+        status = LiveStatus(2, stream)
+        status.refresh()
+        status.set(1, "x")
+        status.refresh()
+        assert stream.getvalue() == "\n\rx\033[K"
+
+    def test_threads(self):
+        """Test concurrent updates from worker threads."""
+        stream = io.StringIO()
+
+        def work(slot):
+            for i in range(1000):
+                status.set(slot, f"worker {slot}: {i}")
+
+        with LiveStatus(8, stream, refresh_rate=1000) as status:
+            threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # every slot's final state has been drawn
+        output = stream.getvalue()
+        for slot in range(8):
+            assert f"worker {slot}: 999" in output
+        assert output.endswith("\n")
+
+    def test_start_twice(self):
+        """Test that a running display cannot be started again."""
+        status = LiveStatus(1, io.StringIO())
+        status.start()
+        try:
+            with pytest.raises(RuntimeError):
+                status.start()
+        finally:
+            status.close()
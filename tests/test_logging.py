@@ -0,0 +1,206 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import io
+import logging
+import os
+import sys
+
+import pytest
+
+from tinterm.attributes import Color, Modifier, Style, StyleKey
+from tinterm.logging import FileHandler, Formatter, StreamHandler
+from tinterm.render import auto_colors, disable_colors, enable_colors, use_colors
+from tinterm.terminal import clear_cache
+
+
+def make_record(level=logging.WARNING, msg="disk %s", args=("full",)):
+    return logging.LogRecord("app", level, __file__, 1, msg, args, None)
+
+
+class TestFormatter:
+    """Tests for the colored logging Formatter."""
+
+    def setup_method(self):
+        enable_colors()
+
+    def teardown_method(self):
+        enable_colors()
+
+    @pytest.mark.parametrize(
+        "fmt, style",
+        [
+            ("%(levelname)-8s|%(message)s", "%"),
+            ("{levelname:<8}|{message}", "{"),
+        ],
+    )
+    def test_levelname_is_styled(self, fmt, style):
+        """Test that the level name keeps its format spec inside the style."""
+        formatter = Formatter(fmt, style=style)
+        assert formatter.format(make_record()) == "\033[33mWARNING \033[0m|disk full"
+
+    def test_template_style(self):
+        """Test $-style format strings."""
+        formatter = Formatter("${levelname}: $message", style="$")
+        result = formatter.format(make_record(logging.ERROR))
+        assert result == "\033[31mERROR\033[0m: disk full"
+
+    def test_basic_format(self):
+        """Test the format string of logging.basicConfig()."""
+        formatter = Formatter(logging.BASIC_FORMAT)
+        result = formatter.format(make_record(logging.CRITICAL))
+        assert result == "\033[31;1mCRITICAL\033[0m:app:disk full"
+
+    def test_format_without_levelname(self):
+        """Test that format strings without a level name are unchanged."""
+        formatter = Formatter("%(name)s %(message)s")
+        assert formatter.format(make_record()) == "app disk full"
+
+    def test_custom_level_styles(self):
+        """Test overriding level styles with Style objects and dicts."""
+        formatter = Formatter(
+            "%(levelname)s",
+            level_styles={
+                logging.INFO: Style(Color.CYAN),
+                logging.WARNING: {StyleKey.MODIFIERS: [Modifier.UNDERLINE]},
+            },
+        )
+        assert formatter.format(make_record(logging.INFO)) == "\033[36mINFO\033[0m"
+        assert formatter.format(make_record()) == "\033[4mWARNING\033[0m"
+
+    def test_custom_levels_use_closest_lower_style(self):
+        """Test that levels between the standard ones reuse a lower style."""
+        formatter = Formatter("%(levelname)s")
+        assert formatter.format(make_record(25)) == "\033[32mLevel 25\033[0m"
+        assert formatter.format(make_record(5)) == "Level 5"
+
+    def test_global_color_switch(self):
+        """Test that colors=None follows disable_colors()."""
+        formatter = Formatter("%(levelname)s %(message)s")
+        formatter.format(make_record())
+        disable_colors()
+        assert formatter.format(make_record()) == "WARNING disk full"
+
+    def test_per_handler_colors(self):
+        """Test that handlers can fix the color setting."""
+        plain = logging.StreamHandler(io.StringIO())
+        plain.setFormatter(Formatter("%(levelname)s", colors=False))
+        colored = logging.StreamHandler(io.StringIO())
+        colored.setFormatter(Formatter("%(levelname)s", colors=True))
+        disable_colors()
+
+        logger = logging.getLogger("tinterm.tests.handlers")
+        logger.propagate = False
+        logger.addHandler(plain)
+        logger.addHandler(colored)
+        try:
+            logger.warning("x")
+        finally:
+            logger.removeHandler(plain)
+            logger.removeHandler(colored)
+
+        assert plain.stream.getvalue() == "WARNING\n"
+        assert colored.stream.getvalue() == "\033[33mWARNING\033[0m\n"
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 10), reason="defaults= needs Python 3.10"
+    )
+    @pytest.mark.parametrize(
+        "fmt, style",
+        [("%(levelname)s %(app)s", "%"), ("{levelname} {app}", "{")],
+    )
+    def test_defaults(self, fmt, style):
+        """Test that field defaults are kept by the colored templates."""
+        formatter = Formatter(fmt, style=style, defaults={"app": "svc"})
+        assert formatter.format(make_record()) == "\033[33mWARNING\033[0m svc"
+        disable_colors()
+        assert formatter.format(make_record()) == "WARNING svc"
+
+    def test_exception_text(self):
+        """Test that tracebacks are appended after the styled message."""
+        formatter = Formatter("%(levelname)s %(message)s")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord(
+                "app", logging.ERROR, __file__, 1, "failed", (), sys.exc_info()
+            )
+        result = formatter.format(record)
+        assert result.startswith("\033[31mERROR\033[0m failed\nTraceback")
+        assert result.endswith("ValueError: boom")
+
+
+class TestStreamColors:
+    """Tests for handlers that detect colors on their own stream."""
+
+    def setup_method(self):
+        clear_cache()
+        auto_colors()
+
+    def teardown_method(self):
+        clear_cache()
+        enable_colors()
+
+    @pytest.fixture
+    def tty(self, monkeypatch):
+        # a pseudo terminal, so detection sees a real tty
+        if not hasattr(os, "openpty"):
+            pytest.skip("pseudo terminals are not available")
+        for name in ("NO_COLOR", "FORCE_COLOR", "COLORTERM"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv("TERM", "xterm")
+        leader, follower = os.openpty()
+        stream = open(follower, "w", closefd=False)
+        yield stream
+        stream.close()
+        os.close(leader)
+        os.close(follower)
+
+    def test_file_while_stdout_is_a_terminal(self, monkeypatch, tty, tmp_path):
+        """Test that a log file gets no colors because stdout is a terminal."""
+        monkeypatch.setattr(sys, "stdout", tty)
+        path = tmp_path / "app.log"
+        with open(path, "w") as stream:
+            handler = StreamHandler(stream)
+            handler.setFormatter(Formatter("%(levelname)s"))
+            handler.handle(make_record())
+        assert path.read_text() == "WARNING\n"
+
+        handler = FileHandler(path)
+        handler.setFormatter(Formatter("%(levelname)s"))
+        try:
+            handler.handle(make_record())
+        finally:
+            handler.close()
+        assert path.read_text() == "WARNING\n" * 2
+
+    def test_terminal_while_stdout_is_a_file(self, monkeypatch, tty):
+        """Test that a terminal gets colors when stdout is not one."""
+        monkeypatch.setattr(sys, "stdout", io.StringIO())
+        handler = StreamHandler(tty)
+        formatter = Formatter("%(levelname)s")
+        handler.setFormatter(formatter)
+        assert handler.format(make_record()) == "\033[33mWARNING\033[0m"
+        # the detected setting applies only while the handler formats
+        assert formatter.format(make_record()) == "WARNING"
+
+    def test_explicit_settings_win(self, tty):
+        """Test that use_colors() and colors= are not overridden."""
+        handler = StreamHandler(tty)
+        handler.setFormatter(Formatter("%(levelname)s"))
+        with use_colors(False):
+            assert handler.format(make_record()) == "WARNING"
+        handler.setFormatter(Formatter("%(levelname)s", colors=False))
+        assert handler.format(make_record()) == "WARNING"
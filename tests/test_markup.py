@@ -0,0 +1,97 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from tinterm.attributes import Color, Modifier, Style
+from tinterm.markup import markup
+from tinterm.styled import StyledText
+
+
+def styles(text):
+    return [(p.text, p.compiled_style) for p in text.parts]
+
+
+class TestMarkup:
+    """Tests for the markup parser."""
+
+    def test_plain_text(self):
+        """Test that text without tags is a single plain part."""
+        assert styles(markup("hello")) == [("hello", Style())]
+
+    def test_tags(self):
+        """Test colors, modifiers and backgrounds in one tag."""
+        result = markup("[red bold on blue]error[/] done")
+        assert styles(result) == [
+            ("error", Style(Color.RED, Color.BLUE, [Modifier.BOLD])),
+            (" done", Style()),
+        ]
+
+    def test_bright_colors(self):
+        """Test color names with underscores."""
+        assert styles(markup("[bright_cyan]x")) == [("x", Style(Color.BRIGHT_CYAN))]
+
+    def test_nesting(self):
+        """Test that inner tags build on the outer style."""
+        result = markup("[red]a[bold]b[blue]c[/]d[/]e[/]f")
+        assert styles(result) == [
+            ("a", Style(Color.RED)),
+            ("b", Style(Color.RED, modifiers=[Modifier.BOLD])),
+            ("c", Style(Color.BLUE, modifiers=[Modifier.BOLD])),
+            ("d", Style(Color.RED, modifiers=[Modifier.BOLD])),
+            ("e", Style(Color.RED)),
+            ("f", Style()),
+        ]
+
+    def test_close_by_name(self):
+        """Test closing a tag that is not the innermost one."""
+        result = markup("[red]a[bold]b[/red]c[/]d")
+        assert styles(result) == [
+            ("a", Style(Color.RED)),
+            ("b", Style(Color.RED, modifiers=[Modifier.BOLD])),
+            ("c", Style(modifiers=[Modifier.BOLD])),
+            ("d", Style()),
+        ]
+
+    def test_unknown_tags_stay_literal(self):
+        """Test that brackets which are not tags are kept as text."""
+        text = "[foo] [1, 2] [] [on] [/] [/red] [red purple]"
+        assert styles(markup(text)) == [(text, Style())]
+
+    def test_escaped_bracket(self):
+        """Test that a backslash escapes a tag."""
+        assert styles(markup(r"\[red]x")) == [("[red]x", Style())]
+
+    def test_values(self):
+        """Test substitution of values into the parsed markup."""
+        result = markup("[red]error[/] in {file}", file="[bold]x.py")
+        assert styles(result) == [
+            ("error", Style(Color.RED)),
+            (" in [bold]x.py", Style()),
+        ]
+
+    def test_braces_without_values(self):
+        """Test that braces are left alone when no values are given."""
+        assert str(markup("{file}")) == "{file}"
+
+    def test_escaped_braces(self):
+        """Test that doubled braces are unescaped with and without values."""
+        assert str(markup("a {{b}}")) == "a {b}"
+        assert str(markup("a {{b}} {c}", c=1)) == "a {b} 1"
+        assert str(markup("[red]{{[/]{c}", c=1)) == "{1"
+
+    def test_parsed_markup_is_cached(self):
+        """Test that repeated markup strings are parsed only once."""
+        first = markup("[green]ok[/]")
+        assert markup("[green]ok[/]") is first
+        assert isinstance(first, StyledText)
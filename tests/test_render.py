@@ -12,8 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from tinterm.attributes import Color, Modifier, StyleKey
-from tinterm.render import _render_no_color, disable_colors, enable_colors, render
+import asyncio
+import io
+import threading
+
+import pytest
+
+from tinterm.attributes import Color, Modifier, Style, StyleKey
+from tinterm.render import (
+    _CHUNK_SIZE,
+    _encoded_segments,
+    _render_no_color,
+    disable_colors,
+    enable_colors,
+    render,
+    render_bytes,
+    render_bytes_iter,
+    render_iter,
+    render_to,
+    use_colors,
+)
 from tinterm.styled import StyledString, StyledText
 
 
@@ -80,6 +98,83 @@ class TestEnableDisableColors:
         enable_colors()
 
 
+class TestColorContext:
+    """Tests for per-context and per-call color settings."""
+
+    def setup_method(self):
+        enable_colors()
+
+    def teardown_method(self):
+        enable_colors()
+
+    def styled(self):
+        return StyledString("test", style={StyleKey.FOREGROUND: Color.RED})
+
+    def test_use_colors(self):
+        """Test that use_colors overrides the global setting inside the block."""
+        with use_colors(False):
+            assert render(self.styled()) == "test"
+            with use_colors(True):
+                assert render(self.styled()) == "\033[31mtest\033[0m"
+            assert render(self.styled()) == "test"
+        assert render(self.styled()) == "\033[31mtest\033[0m"
+
+    def test_use_colors_ignores_global_switch(self):
+        """Test that the context setting wins over enable/disable_colors."""
+        with use_colors(True):
+            disable_colors()
+            assert render(self.styled()) == "\033[31mtest\033[0m"
+            with use_colors(None):
+                assert render(self.styled()) == "test"
+
+    def test_color_argument(self):
+        """Test that the color argument wins over every other setting."""
+        with use_colors(True):
+            assert render(self.styled(), color=False) == "test"
+        disable_colors()
+        s = self.styled()
+        assert render(s, color=True) == "\033[31mtest\033[0m"
+        assert render_bytes(s, color=True) == b"\033[31mtest\033[0m"
+        assert "".join(render_iter(s, color=True)) == "\033[31mtest\033[0m"
+        assert b"".join(render_bytes_iter(s, color=True)) == b"\033[31mtest\033[0m"
+        stream = io.StringIO()
+        render_to(s, stream, color=True)
+        assert stream.getvalue() == "\033[31mtest\033[0m"
+
+    def test_threads_are_isolated(self):
+        """Test that a thread's setting doesn't leak into other threads."""
+        results = {}
+        inside = threading.Event()
+        checked = threading.Event()
+
+        def plain():
+            with use_colors(False):
+                inside.set()
+                checked.wait()
+                results["plain"] = render(self.styled())
+
+        thread = threading.Thread(target=plain)
+        thread.start()
+        inside.wait()
+        results["main"] = render(self.styled())
+        checked.set()
+        thread.join()
+        assert results == {"plain": "test", "main": "\033[31mtest\033[0m"}
+
+    def test_tasks_are_isolated(self):
+        """Test that asyncio tasks keep their own setting."""
+
+        async def task(enabled):
+            with use_colors(enabled):
+                await asyncio.sleep(0)
+                return render(self.styled())
+
+        async def main():
+            return await asyncio.gather(task(False), task(True))
+
+        assert asyncio.run(main()) == ["test", "\033[31mtest\033[0m"]
+
+
 class TestRenderNoColor:
     """Tests for the _render_no_color() internal function."""
 
@@ -292,6 +387,19 @@ class TestRenderStyledString:
             result = render(s)
             assert f"\033[{code}m" in result
 
+    def test_render_with_style_object(self):
+        """Test rendering a StyledString built from a Style."""
+        s = StyledString("hello", style=Style(Color.RED, modifiers=[Modifier.BOLD]))
+        result = render(s)
+        assert result == "\033[31;1mhello\033[0m"
+
+    def test_render_style_object_matches_dict(self):
+        """Test that a Style and the equivalent dict render identically."""
+        style = {StyleKey.FOREGROUND: Color.CYAN, StyleKey.BACKGROUND: Color.BLACK}
+        assert render(StyledString("x", style=style)) == render(
+            StyledString("x", style=Style.from_mapping(style))
+        )
+
 
 class TestRenderStyledText:
     """Tests for rendering StyledText objects."""
@@ -611,3 +719,281 @@ class TestRenderIntegration:
     def teardown_method(self):
         """Re-enable colors after each test."""
         enable_colors()
+
+
+class TestRenderMinimal:
+    """Tests for render(..., minimal=True)."""
+
+    def setup_method(self):
+        """Ensure colors are enabled before each test."""
+        enable_colors()
+
+    def test_minimal_single_part(self):
+        """Test that a single part renders like the default mode."""
+        s = StyledString("hello", style={StyleKey.FOREGROUND: Color.RED})
+        assert render(s, minimal=True) == "\033[31mhello\033[0m"
+
+    def test_minimal_unstyled(self):
+        """Test that unstyled text has no escape codes at all."""
+        st = StyledString("a") + StyledString("b")
+        assert render(st, minimal=True) == "ab"
+
+    def test_minimal_same_style_is_merged(self):
+        """Test that adjacent parts with the same style share one prefix."""
+        red = {StyleKey.FOREGROUND: Color.RED}
+        st = StyledString("hello", style=red) + StyledString(" world", style=red)
+        assert render(st, minimal=True) == "\033[31mhello world\033[0m"
+
+    def test_minimal_only_changed_attribute(self):
+        """Test that only the changed foreground is emitted."""
+        st = StyledString(
+            "a", style={StyleKey.FOREGROUND: Color.RED, StyleKey.BACKGROUND: Color.BLUE}
+        ) + StyledString(
+            "b",
+            style={StyleKey.FOREGROUND: Color.GREEN, StyleKey.BACKGROUND: Color.BLUE},
+        )
+        assert render(st, minimal=True) == "\033[31;44ma\033[32mb\033[0m"
+
+    def test_minimal_attribute_removed(self):
+        """Test that dropped attributes are switched off individually."""
+        st = StyledString(
+            "a",
+            style={
+                StyleKey.FOREGROUND: Color.RED,
+                StyleKey.BACKGROUND: Color.BLUE,
+                StyleKey.MODIFIERS: [Modifier.UNDERLINE],
+            },
+        ) + StyledString(
+            "b", style={StyleKey.FOREGROUND: Color.RED, StyleKey.BACKGROUND: Color.BLUE}
+        )
+        assert render(st, minimal=True) == "\033[31;44;4ma\033[24mb\033[0m"
+
+    def test_minimal_bold_to_dim(self):
+        """Test that turning off bold keeps dim by re-emitting it."""
+        st = StyledString(
+            "a",
+            style={
+                StyleKey.FOREGROUND: Color.RED,
+                StyleKey.MODIFIERS: [Modifier.BOLD, Modifier.DIM],
+            },
+        ) + StyledString(
+            "b",
+            style={StyleKey.FOREGROUND: Color.RED, StyleKey.MODIFIERS: [Modifier.DIM]},
+        )
+        assert render(st, minimal=True) == "\033[31;1;2ma\033[22;2mb\033[0m"
+
+    def test_minimal_prefers_shorter_reset(self):
+        """Test that a reset is used when it is shorter than the diff."""
+        st = StyledString(
+            "a", style={StyleKey.MODIFIERS: [Modifier.BOLD, Modifier.DIM]}
+        ) + StyledString("b", style={StyleKey.MODIFIERS: [Modifier.DIM]})
+        assert render(st, minimal=True) == "\033[1;2ma\033[0;2mb\033[0m"
+
+    def test_minimal_back_to_plain(self):
+        """Test that returning to unstyled text emits a reset."""
+        st = (
+            StyledString("a", style={StyleKey.FOREGROUND: Color.RED})
+            + "b"
+            + StyledString("c", style={StyleKey.FOREGROUND: Color.RED})
+        )
+        assert render(st, minimal=True) == "\033[31ma\033[0mb\033[31mc\033[0m"
+
+    def test_minimal_skips_empty_parts(self):
+        """Test that empty parts do not cause style changes."""
+        red = {StyleKey.FOREGROUND: Color.RED}
+        st = (
+            StyledString("a", style=red)
+            + StyledString("", style={StyleKey.FOREGROUND: Color.BLUE})
+            + StyledString("b", style=red)
+        )
+        assert render(st, minimal=True) == "\033[31mab\033[0m"
+
+    def test_minimal_is_shorter(self):
+        """Test that minimal output is never longer than the default."""
+        bg = {StyleKey.BACKGROUND: Color.BLACK}
+        st = StyledText(
+            StyledString(str(i), style={**bg, StyleKey.FOREGROUND: c})
+            for i, c in enumerate([Color.RED, Color.RED, Color.GREEN, Color.BLUE])
+        )
+        assert len(render(st, minimal=True)) < len(render(st))
+
+    def test_minimal_reordered_modifiers(self):
+        """Test that the same modifiers in another order need no escape code."""
+        first = Style(Color.RED, modifiers=[Modifier.BOLD, Modifier.UNDERLINE])
+        second = Style(Color.RED, modifiers=[Modifier.UNDERLINE, Modifier.BOLD])
+        st = StyledString("x", first) + StyledString("y", second)
+        assert render(st, minimal=True) == "\033[31;1;4mxy\033[0m"
+        assert render_bytes(st, minimal=True) == b"\033[31;1;4mxy\033[0m"
+
+    def test_minimal_disabled_colors(self):
+        """Test that minimal mode respects disabled colors."""
+        disable_colors()
+        s = StyledString("hello", style={StyleKey.FOREGROUND: Color.RED})
+        assert render(s, minimal=True) == "hello"
+
+    def teardown_method(self):
+        """Re-enable colors after each test."""
+        enable_colors()
+
+
+class TestRenderStreaming:
+    """Tests for render_iter() and render_to()."""
+
+    def setup_method(self):
+        """Ensure colors are enabled before each test."""
+        enable_colors()
+
+    def _sample(self):
+        return StyledText(
+            StyledString(
+                f"part{i} ", style={StyleKey.FOREGROUND: Color.RED} if i % 2 else None
+            )
+            for i in range(100)
+        )
+
+    def test_render_iter_matches_render(self):
+        """Test that joined chunks equal the rendered string."""
+        st = self._sample()
+        assert "".join(render_iter(st, chunk_size=7)) == render(st)
+
+    def test_render_iter_chunks_are_bounded(self):
+        """Test that every chunk is at most chunk_size long."""
+        chunks = list(render_iter(self._sample(), chunk_size=16))
+        assert len(chunks) > 1
+        assert all(len(c) == 16 for c in chunks[:-1])
+        assert 0 < len(chunks[-1]) <= 16
+
+    def test_render_iter_long_part_is_split(self):
+        """Test that a single part longer than chunk_size is split."""
+        s = StyledString("x" * 100)
+        assert list(render_iter(s, chunk_size=40)) == ["x" * 40, "x" * 40, "x" * 20]
+
+    def test_render_iter_empty(self):
+        """Test that empty input yields no chunks."""
+        assert list(render_iter(StyledText([]))) == []
+
+    def test_render_iter_minimal(self):
+        """Test that render_iter supports the minimal mode."""
+        st = self._sample()
+        assert "".join(render_iter(st, chunk_size=5, minimal=True)) == render(
+            st, minimal=True
+        )
+
+    def test_render_iter_disabled_colors(self):
+        """Test that render_iter respects disabled colors."""
+        disable_colors()
+        st = self._sample()
+        assert "".join(render_iter(st, chunk_size=10)) == str(st)
+
+    def test_render_iter_invalid_chunk_size(self):
+        """Test that a non-positive chunk size is rejected."""
+        with pytest.raises(ValueError):
+            list(render_iter(StyledString("x"), chunk_size=0))
+
+    def test_render_to_text_stream(self):
+        """Test writing to a text stream."""
+        st = self._sample()
+        stream = io.StringIO()
+        render_to(st, stream, chunk_size=32)
+        assert stream.getvalue() == render(st)
+
+    def test_render_to_binary_stream(self):
+        """Test writing to a binary stream encodes the output."""
+        st = StyledString("Hello 世界", style={StyleKey.FOREGROUND: Color.BLUE})
+        stream = io.BytesIO()
+        render_to(st, stream)
+        assert stream.getvalue() == render(st).encode("utf-8")
+
+    def test_render_to_raw_stream_partial_writes(self):
+        """Test that short writes on raw streams are retried."""
+
+        class Raw(io.RawIOBase):
+            def __init__(self):
+                self.data = bytearray()
+
+            def writable(self):
+                return True
+
+            def write(self, b):
+                self.data += bytes(b[:5])
+                return min(5, len(b))
+
+        st = self._sample()
+        stream = Raw()
+        render_to(st, stream, chunk_size=50)
+        assert bytes(stream.data) == render(st).encode("utf-8")
+
+    def test_render_to_writes_incrementally(self):
+        """Test that render_to writes several chunks."""
+        writes = []
+
+        class Stream:
+            def write(self, data):
+                writes.append(data)
+
+        render_to(self._sample(), Stream(), chunk_size=64)
+        assert len(writes) > 1
+
+    def teardown_method(self):
+        """Re-enable colors after each test."""
+        enable_colors()
+
+
+class TestRenderBytes:
+    """Tests for render_bytes() and render_bytes_iter()."""
+
+    def setup_method(self):
+        """Ensure colors are enabled before each test."""
+        enable_colors()
+
+    def _sample(self):
+        return (
+            StyledString("Fehler", style={StyleKey.FOREGROUND: Color.RED})
+            + " in "
+            + StyledString("世界.py", style={StyleKey.MODIFIERS: [Modifier.BOLD]})
+        )
+
+    def test_render_bytes_matches_render(self):
+        """Test that render_bytes equals the encoded render output."""
+        st = self._sample()
+        assert render_bytes(st) == render(st).encode("utf-8")
+
+    def test_render_bytes_minimal(self):
+        """Test that render_bytes supports the minimal mode."""
+        st = self._sample() + StyledString("!", style={StyleKey.FOREGROUND: Color.RED})
+        assert render_bytes(st, minimal=True) == render(st, minimal=True).encode()
+
+    def test_render_bytes_encoding(self):
+        """Test that a different encoding is honoured."""
+        s = StyledString("café", style={StyleKey.FOREGROUND: Color.GREEN})
+        assert render_bytes(s, encoding="latin-1") == render(s).encode("latin-1")
+
+    def test_render_bytes_disabled_colors(self):
+        """Test that render_bytes respects disabled colors."""
+        disable_colors()
+        st = self._sample()
+        assert render_bytes(st) == str(st).encode("utf-8")
+
+    def test_render_bytes_iter_chunks(self):
+        """Test that render_bytes_iter yields bounded chunks."""
+        st = StyledText([self._sample()] * 20)
+        chunks = list(render_bytes_iter(st, chunk_size=16))
+        assert b"".join(chunks) == render_bytes(st)
+        assert all(len(c) == 16 for c in chunks[:-1])
+        assert all(isinstance(c, bytes) for c in chunks)
+
+    def test_long_part_is_encoded_in_pieces(self):
+        """Test that a part much longer than a chunk is not encoded at once."""
+        s = StyledString("世界" * _CHUNK_SIZE, style={StyleKey.FOREGROUND: Color.RED})
+        segments = list(_encoded_segments(s, False, "utf-8", None))
+        assert b"".join(segments) == render(s).encode("utf-8")
+        assert max(len(segment) for segment in segments) <= 3 * _CHUNK_SIZE
+
+    def test_render_bytes_iter_invalid_chunk_size(self):
+        """Test that a non-positive chunk size is rejected."""
+        with pytest.raises(ValueError):
+            list(render_bytes_iter(StyledString("x"), chunk_size=-1))
+
+    def teardown_method(self):
+        """Re-enable colors after each test."""
+        enable_colors()
@@ -0,0 +1,166 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import io
+
+import pytest
+
+from tinterm.attributes import Color, Modifier, Style, StyleKey
+from tinterm.render import disable_colors, enable_colors
+from tinterm.screen import Screen
+from tinterm.styled import StyledString
+
+
+class TestScreen:
+    """Tests for the Screen cell buffer."""
+
+    def setup_method(self):
+        enable_colors()
+
+    def teardown_method(self):
+        enable_colors()
+
+    def test_invalid_size(self):
+        """Test that empty screens are rejected."""
+        with pytest.raises(ValueError):
+            Screen(0, 5)
+        with pytest.raises(ValueError):
+            Screen(5, -1)
+
+    def test_first_frame_clears(self):
+        """Test that the first frame clears and draws non-blank cells only."""
+        screen = Screen(10, 3)
+        screen.set_line(1, "hello")
+        assert screen.frame() == "\033[H\033[2J\033[2;1Hhello"
+
+    def test_unchanged_frame_is_empty(self):
+        """Test that nothing is written when nothing changed."""
+        screen = Screen(10, 3)
+        screen.set_line(0, "hello")
+        screen.frame()
+        screen.set_line(0, "hello")
+        assert screen.frame() == ""
+
+    def test_only_changed_cells_are_written(self):
+        """Test that a frame writes only the changed run."""
+        screen = Screen(20, 2)
+        screen.set_line(0, "count: 1234")
+        screen.frame()
+        screen.set_line(0, "count: 1299")
+        assert screen.frame() == "\033[1;10H99"
+
+    def test_nearby_changes_are_merged(self):
+        """Test that small gaps are rewritten instead of skipped."""
+        screen = Screen(20, 1)
+        screen.set_line(0, "a b c")
+        screen.frame()
+        screen.set_line(0, "x b y")
+        assert screen.frame() == "\033[1;1Hx b y"
+
+    def test_distant_changes_use_cursor_forward(self):
+        """Test that later runs in a row move the cursor relatively."""
+        screen = Screen(20, 1)
+        screen.set_line(0, "a" * 20)
+        screen.frame()
+        screen.set_line(0, "b" + "a" * 18 + "b")
+        assert screen.frame() == "\033[1;1Hb\033[18Cb"
+
+    def test_style_changes(self):
+        """Test that style-only changes are redrawn with minimal codes."""
+        screen = Screen(10, 1)
+        screen.set_line(0, "ok")
+        screen.frame()
+        screen.set_line(0, StyledString("ok", style={StyleKey.FOREGROUND: Color.RED}))
+        assert screen.frame() == "\033[1;1H\033[31mok\033[0m"
+
+        screen.set_line(0, StyledString("ok", style=Style(Color.RED, Color.WHITE)))
+        assert screen.frame() == "\033[1;1H\033[31;47mok\033[0m"
+
+    def test_reordered_modifiers(self):
+        """Test that equal attribute sets in another order are not reset."""
+        bold_underline = Style(modifiers=[Modifier.BOLD, Modifier.UNDERLINE])
+        underline_bold = Style(modifiers=[Modifier.UNDERLINE, Modifier.BOLD])
+        screen = Screen(5, 1)
+        screen.set_line(
+            0, StyledString("x", bold_underline) + StyledString("y", underline_bold)
+        )
+        assert screen.frame() == "\033[H\033[2J\033[1;1H\033[1;4mxy\033[0m"
+
+    def test_styles_without_colors(self):
+        """Test that no SGR codes are written when colors are disabled."""
+        disable_colors()
+        screen = Screen(10, 1)
+        screen.set_line(0, StyledString("ok", style={StyleKey.FOREGROUND: Color.RED}))
+        assert screen.frame() == "\033[H\033[2J\033[1;1Hok"
+
+    def test_wide_characters(self):
+        """Test that changes next to wide characters redraw the whole character."""
+        screen = Screen(6, 1)
+        screen.set_line(0, "a世b")
+        assert screen.frame() == "\033[H\033[2J\033[1;1Ha世b"
+        screen.set_line(0, "a界b")
+        assert screen.frame() == "\033[1;2H界"
+        screen.set_line(0, "axyb")
+        assert screen.frame() == "\033[1;2Hxy"
+
+    def test_wide_character_at_right_edge(self):
+        """Test that a wide character that doesn't fit is left out."""
+        screen = Screen(4, 1)
+        screen.set_line(0, "abc世d")
+        assert screen.frame() == "\033[H\033[2J\033[1;1Habc"
+
+    def test_long_lines_are_clipped(self):
+        """Test that lines are cut at the screen width."""
+        screen = Screen(3, 1)
+        screen.set_line(0, "abcdef")
+        assert screen.frame() == "\033[H\033[2J\033[1;1Habc"
+
+    def test_set_lines_blanks_remaining_rows(self):
+        """Test that set_lines clears rows it has no line for."""
+        screen = Screen(5, 3)
+        screen.set_lines(["a", "b", "c"])
+        screen.frame()
+        screen.set_lines(["a"])
+        assert screen.frame() == "\033[2;1H \033[3;1H "
+
+    def test_row_out_of_range(self):
+        """Test that rows outside the screen are rejected."""
+        with pytest.raises(IndexError):
+            Screen(5, 2).set_line(2, "x")
+
+    def test_invalidate(self):
+        """Test that invalidate forces a full redraw."""
+        screen = Screen(5, 1)
+        screen.set_line(0, "abc")
+        screen.frame()
+        screen.invalidate()
+        assert screen.frame() == "\033[H\033[2J\033[1;1Habc"
+
+    def test_resize(self):
+        """Test that resizing clears the screen."""
+        screen = Screen(5, 1)
+        screen.set_line(0, "abc")
+        screen.frame()
+        screen.resize(8, 2)
+        assert (screen.width, screen.height) == (8, 2)
+        assert screen.frame() == "\033[H\033[2J"
+
+    def test_render_to_binary_stream(self):
+        """Test writing a frame to a binary stream."""
+        screen = Screen(5, 1)
+        screen.set_line(0, "世")
+        stream = io.BytesIO()
+        screen.render_to(stream)
+        assert stream.getvalue() == "\033[H\033[2J\033[1;1H世".encode()
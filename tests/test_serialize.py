@@ -0,0 +1,143 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pickle
+
+import pytest
+
+from tinterm.attributes import Color, Modifier, Style, StyleKey
+from tinterm.render import render
+from tinterm.serialize import dumps, loads
+from tinterm.styled import StyledString, StyledText
+
+
+def sample():
+    return StyledText(
+        [
+            StyledString("Error", style={StyleKey.FOREGROUND: Color.RED}),
+            StyledString(": "),
+            StyledString("", style=Style(Color.BLUE)),
+            StyledString(
+                "世界 ✓",
+                style=Style(
+                    Color.BRIGHT_WHITE,
+                    Color.BLACK,
+                    [Modifier.UNDERLINE, Modifier.BOLD],
+                ),
+            ),
+            StyledString(" again", style={StyleKey.FOREGROUND: Color.RED}),
+        ]
+    )
+
+
+def assert_same(result, expected):
+    assert len(result.parts) == len(expected.parts)
+    for a, b in zip(result.parts, expected.parts):
+        assert a.text == b.text
+        assert a.compiled_style is b.compiled_style
+        assert a.style == b.style
+
+
+class TestSerialize:
+    """Tests for the compact binary format."""
+
+    def test_round_trip(self):
+        """Test that text, part boundaries and styles survive."""
+        value = sample()
+        result = loads(dumps(value))
+        assert_same(result, value)
+        assert render(result) == render(value)
+
+    def test_styles_are_stored_once(self):
+        """Test that repeated styles share one style table entry."""
+        red = Style(Color.RED)
+        one = dumps(StyledText([StyledString("x", red)]))
+        many = dumps(StyledText([StyledString("x", red)] * 100))
+        # one style id byte, one length byte and one text byte per extra part
+        assert len(many) - len(one) == 99 * 3
+
+    def test_styled_string(self):
+        """Test that a single StyledString loads as a one-part StyledText."""
+        value = StyledString("hi", style=Style(Color.GREEN))
+        result = loads(dumps(value))
+        assert_same(result, StyledText([value]))
+
+    def test_empty(self):
+        """Test an empty StyledText."""
+        assert loads(dumps(StyledText([]))).parts == ()
+
+    def test_large_values(self):
+        """Test parts and style tables beyond one-byte integers."""
+        styles = [Style(c, b) for c in Color for b in Color]
+        value = StyledText(
+            [StyledString("x" * (i % 300), styles[i % len(styles)]) for i in range(600)]
+        )
+        assert_same(loads(dumps(value)), value)
+
+    def test_buffer_types(self):
+        """Test decoding from bytearray and memoryview slices."""
+        data = dumps(sample())
+        assert_same(loads(bytearray(data)), sample())
+        framed = b"\x00\x00" + data
+        assert_same(loads(memoryview(framed)[2:]), sample())
+
+    def test_invalid_data(self):
+        """Test that foreign or truncated data is rejected."""
+        with pytest.raises(ValueError):
+            loads(b"JUNK" + bytes(10))
+        with pytest.raises(ValueError):
+            loads(dumps(sample())[:-2])
+
+    @pytest.mark.parametrize("size", [0, 3, 13, 14, 20])
+    def test_truncated_data(self, size):
+        """Test that data cut inside the header or tables is rejected."""
+        with pytest.raises(ValueError, match="not a serialized StyledText"):
+            loads(dumps(sample())[:size])
+
+    @pytest.mark.parametrize("index, byte", [(14, 200), (15, 200), (16, 15)])
+    def test_invalid_style_codes(self, index, byte):
+        """Test that unknown colors and modifiers are rejected."""
+        data = bytearray(dumps(sample()))
+        data[index] = byte
+        with pytest.raises(ValueError, match="not a serialized StyledText"):
+            loads(data)
+
+    def test_invalid_style_id(self):
+        """Test that style ids outside the style table are rejected."""
+        value = StyledString("x", style={StyleKey.FOREGROUND: Color.RED})
+        data = bytearray(dumps(value))
+        # header, one style entry, then the id of the only part
+        data[14 + 6] = 5
+        with pytest.raises(ValueError, match="not a serialized StyledText"):
+            loads(data)
+
+
+class TestPickle:
+    """Tests for pickling styled values."""
+
+    def test_styled_string(self):
+        """Test that a StyledString pickles with an interned style."""
+        value = StyledString("a", style={StyleKey.FOREGROUND: Color.RED})
+        result = pickle.loads(pickle.dumps(value))
+        assert result.text == "a"
+        assert result.compiled_style is value.compiled_style
+        assert result.style == value.style
+
+    def test_styled_text(self):
+        """Test that a StyledText pickles in the compact format."""
+        value = sample() + " tail"
+        result = pickle.loads(pickle.dumps(value))
+        assert_same(result, value)
+        assert len(pickle.dumps(value)) < len(pickle.dumps([str(value)])) + 100
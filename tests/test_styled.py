@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
+import threading
+
 import pytest
 
-from tinterm.attributes import Color, Modifier, StyleKey
-from tinterm.styled import StyledString, StyledText
+from tinterm.attributes import Color, Modifier, Style, StyleKey
+from tinterm.styled import StyledString, StyledText, StyledTextBuilder
 
 
 class TestStyledString:
@@ -84,6 +87,20 @@ class TestStyledString:
         with pytest.raises(TypeError):
             s.style[StyleKey.BACKGROUND] = Color.BLUE
 
+    def test_init_with_style_object(self):
+        """Test that a Style is shared rather than copied."""
+        style = Style(Color.RED, modifiers=[Modifier.BOLD])
+        s = StyledString("hello", style=style)
+        assert s.style is style
+        assert s.compiled_style is style
+
+    def test_compiled_style_is_interned(self):
+        """Test that equal style dicts compile to the same Style."""
+        s1 = StyledString("a", style={StyleKey.FOREGROUND: Color.RED})
+        s2 = StyledString("b", style={StyleKey.FOREGROUND: Color.RED})
+        assert s1.compiled_style is s2.compiled_style
+        assert StyledString("c").compiled_style is Style()
+
     # style property tests
     def test_style_property_getter(self):
         """Test that style property returns a read-only view with same values."""
@@ -133,6 +150,79 @@ class TestStyledString:
         s = StyledString("")
         assert str(s) == ""
 
+    # display width tests
+    def test_display_width(self):
+        """Test display width of narrow and wide text."""
+        assert StyledString("hello").display_width() == 5
+        assert StyledString("世界").display_width() == 4
+
+    def test_display_width_is_cached(self):
+        """Test that the display width is computed once."""
+        s = StyledString("世界")
+        s.display_width()
+        assert s._width == 4
+
+    def test_ljust(self):
+        """Test left justification keeps the style."""
+        s = StyledString("世界", style={StyleKey.FOREGROUND: Color.RED})
+        result = s.ljust(6)
+        assert isinstance(result, StyledText)
+        assert str(result) == "世界  "
+        assert result.parts[0] is s
+        assert result.parts[1].style == {}
+
+    def test_rjust_and_center(self):
+        """Test right justification and centering."""
+        s = StyledString("ab")
+        assert str(s.rjust(5, "-")) == "---ab"
+        assert str(s.center(7, "*")) == "**ab***"
+
+    def test_justify_no_padding_needed(self):
+        """Test that wide enough text is returned without padding."""
+        s = StyledString("hello")
+        result = s.ljust(3)
+        assert result.parts == (s,)
+
+    def test_justify_invalid_fillchar(self):
+        """Test that the fill character must be a single character."""
+        with pytest.raises(TypeError):
+            StyledString("a").ljust(5, "--")
+
+    def test_truncate(self):
+        """Test truncating a StyledString keeps its style."""
+        s = StyledString("hello world", style={StyleKey.FOREGROUND: Color.RED})
+        result = s.truncate(6)
+        assert str(result) == "hello\u2026"
+        assert result.parts[0].style is s.style
+
+    # __getitem__ tests
+    def test_getitem_index_keeps_style(self):
+        """Test that indexing returns a one-character StyledString."""
+        s = StyledString("hello", style={StyleKey.FOREGROUND: Color.RED})
+        c = s[1]
+        assert isinstance(c, StyledString)
+        assert c.text == "e"
+        assert c.style is s.style
+        assert s[-1].text == "o"
+
+    def test_getitem_slice_keeps_style(self):
+        """Test that slicing shares the style of the original."""
+        s = StyledString("hello", style={StyleKey.FOREGROUND: Color.RED})
+        part = s[1:3]
+        assert part.text == "el"
+        assert part.style is s.style
+        assert part.compiled_style is s.compiled_style
+
+    def test_getitem_full_slice_returns_self(self):
+        """Test that a full slice does not allocate a copy."""
+        s = StyledString("hello")
+        assert s[:] is s
+
+    def test_getitem_out_of_range(self):
+        """Test that indexing past the end raises IndexError."""
+        with pytest.raises(IndexError):
+            StyledString("abc")[3]
+
     # __add__ tests
     def test_add_two_styled_strings(self):
         """Test adding two StyledStrings creates StyledText."""
@@ -371,6 +461,238 @@ class TestStyledText:
         )
         assert len(st) == 10
 
+    def test_len_is_cached(self):
+        """Test that the length is computed once and reused."""
+        st = StyledText([StyledString("hello"), StyledString("world")])
+        assert len(st) == 10
+        assert st._length == 10
+
+    def test_len_of_concatenation_without_flattening(self):
+        """Test that len() of a concatenation does not flatten it."""
+        st = StyledText([StyledString("ab")]) + StyledString("cde")
+        assert len(st) == 5
+        assert st._parts is None
+
+    def test_concurrent_flattening(self):
+        """Test flattening shared rope nodes from several threads at once."""
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        errors = []
+
+        def flatten(texts):
+            try:
+                for text in texts:
+                    assert str(text).startswith("0")
+            except Exception as error:
+                errors.append(error)
+
+        try:
+            for _ in range(10):
+                base = StyledString("0")
+                shared = []
+                for i in range(200):
+                    base = base + StyledString(str(i % 10))
+                    shared.append(base)
+                threads = [
+                    threading.Thread(target=flatten, args=(shared[::step],))
+                    for step in (1, -1, 3, -2)
+                ]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        assert errors == []
+
+    # _locate tests
+    def test_locate(self):
+        """Test mapping character indices to parts."""
+        st = StyledText([StyledString("ab"), StyledString(""), StyledString("cde")])
+        assert st._locate(0) == (0, 0)
+        assert st._locate(1) == (0, 1)
+        assert st._locate(2) == (2, 0)
+        assert st._locate(4) == (2, 2)
+
+    def test_locate_offsets_are_cached(self):
+        """Test that the offset index is built once."""
+        st = StyledText([StyledString("ab"), StyledString("cd")])
+        st._locate(3)
+        offsets = st._offsets
+        st._locate(1)
+        assert st._offsets is offsets
+        assert offsets == (0, 2)
+
+    # display width tests
+    def test_display_width(self):
+        """Test display width summed over parts."""
+        st = StyledText([StyledString("ab"), StyledString("世界"), StyledString("")])
+        assert st.display_width() == 6
+        assert (st + "🌍").display_width() == 8
+
+    def test_ljust_rjust_center(self):
+        """Test width-aware justification of styled text."""
+        red = StyledString("世", style={StyleKey.FOREGROUND: Color.RED})
+        st = red + "x"
+        assert str(st.ljust(5)) == "世x  "
+        assert str(st.rjust(5)) == "  世x"
+        assert str(st.center(6, ".")) == ".世x.."
+        assert st.ljust(5).parts[0] is red
+
+    # truncate tests
+    def _path(self):
+        return StyledText(
+            [
+                StyledString("/home/user/", style={StyleKey.FOREGROUND: Color.BLUE}),
+                StyledString("project", style={StyleKey.MODIFIERS: [Modifier.BOLD]}),
+                StyledString("/main.py", style={StyleKey.FOREGROUND: Color.GREEN}),
+            ]
+        )
+
+    def test_truncate_fitting_text_is_unchanged(self):
+        """Test that text within the width is returned as-is."""
+        st = self._path()
+        assert st.truncate(26) is st
+        assert st.truncate(100) is st
+
+    def test_truncate_end(self):
+        """Test truncating at the end keeps the styles of the kept parts."""
+        result = self._path().truncate(15)
+        assert str(result) == "/home/user/pro\u2026"
+        assert result.display_width() == 15
+        assert result.parts[0].style[StyleKey.FOREGROUND] == Color.BLUE
+        assert result.parts[1].style[StyleKey.MODIFIERS] == [Modifier.BOLD]
+        assert result.parts[-1].style == {}
+
+    def test_truncate_middle(self):
+        """Test truncating in the middle keeps both ends."""
+        result = self._path().truncate(15, side="middle")
+        assert str(result) == "/home/u\u2026main.py"
+        assert result.display_width() == 15
+        assert result.parts[-1].style[StyleKey.FOREGROUND] == Color.GREEN
+
+    def test_truncate_custom_ellipsis(self):
+        """Test a plain and a styled ellipsis."""
+        assert str(self._path().truncate(10, "...")) == "/home/u..."
+        dots = StyledString("..", style={StyleKey.FOREGROUND: Color.RED})
+        result = self._path().truncate(10, dots)
+        assert result.parts[-1] is dots
+
+    def test_truncate_wide_characters(self):
+        """Test that wide characters are never split."""
+        st = StyledText([StyledString("世界世界")])
+        assert str(st.truncate(6)) == "世界\u2026"
+        assert str(st.truncate(5)) == "世界\u2026"
+        assert st.truncate(4).display_width() <= 4
+
+    def test_truncate_emoji_variation_selector(self):
+        """Test that symbols widened by VS16 are measured like display_width."""
+        st = StyledText([StyledString("\u2600\ufe0f\u2600\ufe0fab\u2600\ufe0f")])
+        for width in range(st.display_width()):
+            for side in ("end", "middle"):
+                result = st.truncate(width, side=side)
+                assert result.display_width() <= width
+        assert str(st.truncate(3)) == "\u2600\ufe0f\u2026"
+        assert str(StyledString("\u2600\ufe0f\u2600\ufe0f").truncate(3)) == (
+            "\u2600\ufe0f\u2026"
+        )
+
+    def test_truncate_narrower_than_ellipsis(self):
+        """Test that very small widths cut without an ellipsis."""
+        assert str(self._path().truncate(2, "...")) == "/h"
+        assert str(self._path().truncate(0)) == ""
+
+    def test_truncate_invalid_side(self):
+        """Test that unknown sides are rejected."""
+        with pytest.raises(ValueError):
+            self._path().truncate(5, side="start")
+
+    def test_truncate_negative_width(self):
+        """Test that negative widths are rejected."""
+        with pytest.raises(ValueError):
+            self._path().truncate(-1)
+        with pytest.raises(ValueError):
+            StyledString("hello").truncate(-1)
+
+    def test_justify_returns_self_when_wide_enough(self):
+        """Test that no copy is made when no padding is needed."""
+        st = StyledText([StyledString("hello")])
+        assert st.rjust(2) is st
+
+    # __getitem__ tests
+    def _sample(self):
+        return StyledText(
+            [
+                StyledString("hello", style={StyleKey.FOREGROUND: Color.RED}),
+                StyledString(""),
+                StyledString(" ", style={}),
+                StyledString("world", style={StyleKey.FOREGROUND: Color.BLUE}),
+            ]
+        )
+
+    def test_getitem_index(self):
+        """Test that indexing returns a styled character."""
+        st = self._sample()
+        c = st[6]
+        assert isinstance(c, StyledString)
+        assert c.text == "w"
+        assert c.style[StyleKey.FOREGROUND] == Color.BLUE
+        assert st[0].style[StyleKey.FOREGROUND] == Color.RED
+        assert st[5].text == " "
+        assert st[-1].text == "d"
+
+    def test_getitem_index_out_of_range(self):
+        """Test that out of range indices raise IndexError."""
+        st = self._sample()
+        with pytest.raises(IndexError):
+            st[11]
+        with pytest.raises(IndexError):
+            st[-12]
+        with pytest.raises(IndexError):
+            StyledText([])[0]
+
+    def test_getitem_slice_splits_boundary_parts(self):
+        """Test that a slice splits the parts at both ends."""
+        st = self._sample()
+        result = st[3:8]
+        assert isinstance(result, StyledText)
+        assert str(result) == "lo wo"
+        assert [p.text for p in result.parts] == ["lo", "", " ", "wo"]
+        assert result.parts[0].style[StyleKey.FOREGROUND] == Color.RED
+        assert result.parts[3].style[StyleKey.FOREGROUND] == Color.BLUE
+
+    def test_getitem_slice_within_one_part(self):
+        """Test a slice that stays inside a single part."""
+        result = self._sample()[7:9]
+        assert [p.text for p in result.parts] == ["or"]
+        assert result.parts[0].style[StyleKey.FOREGROUND] == Color.BLUE
+
+    def test_getitem_slice_reuses_whole_parts(self):
+        """Test that fully covered parts are not copied."""
+        st = self._sample()
+        result = st[:]
+        assert str(result) == "hello world"
+        assert result.parts[0] is st.parts[0]
+        assert result.parts[-1] is st.parts[-1]
+
+    def test_getitem_slice_matches_str(self):
+        """Test that slicing agrees with slicing the plain text."""
+        st = self._sample()
+        text = str(st)
+        for start in range(-12, 13):
+            for stop in range(-12, 13):
+                assert str(st[start:stop]) == text[start:stop]
+
+    def test_getitem_slice_with_step(self):
+        """Test that extended slices are supported."""
+        st = self._sample()
+        assert str(st[::2]) == "hlowrd"
+        assert str(st[::-1]) == "dlrow olleh"
+
+    def test_getitem_empty_slice(self):
+        """Test that an empty slice returns an empty StyledText."""
+        assert self._sample()[5:5].parts == ()
+
     # __iter__ tests
     def test_iter_empty(self):
         """Test iterating over empty StyledText."""
@@ -451,6 +773,34 @@ class TestStyledText:
         assert len(result.parts) == 3
         assert str(result) == "abc"
 
+    def test_add_does_not_copy_operands(self):
+        """Test that concatenation defers flattening until parts are needed."""
+        st1 = StyledText([StyledString("a"), StyledString("b")])
+        result = st1 + StyledString("c")
+        assert result._parts is None
+        assert str(result) == "abc"
+        assert isinstance(result.parts, tuple)
+        assert result.parts is result.parts
+
+    def test_add_in_loop_builds_long_text(self):
+        """Test that repeated += stays correct for many parts."""
+        text = StyledText([])
+        for i in range(50000):
+            text += StyledString(str(i % 10))
+        assert len(text.parts) == 50000
+        assert str(text).startswith("0123456789")
+        assert len(text) == 50000
+
+    def test_add_leaves_operands_unchanged(self):
+        """Test that flattening a concatenation does not change its operands."""
+        left = StyledString("a") + StyledString("b")
+        right = StyledString("c") + StyledString("d")
+        combined = left + right
+        assert str(combined) == "abcd"
+        assert str(left) == "ab"
+        assert str(right) == "cd"
+        assert len(combined.parts) == 4
+
     # __radd__ tests
     def test_radd_plain_string_and_styled_text(self):
         """Test right addition with plain string."""
@@ -515,6 +865,72 @@ class TestStyledText:
         assert str(st) == "helloworld"
 
 
+class TestStyledTextBuilder:
+    """Tests for the StyledTextBuilder class."""
+
+    def test_build_empty(self):
+        """Test that an empty builder produces an empty StyledText."""
+        st = StyledTextBuilder().build()
+        assert isinstance(st, StyledText)
+        assert st.parts == ()
+
+    def test_append_styled_string(self):
+        """Test that appended StyledStrings are kept as-is."""
+        s1 = StyledString("a", style={StyleKey.FOREGROUND: Color.RED})
+        s2 = StyledString("b")
+        builder = StyledTextBuilder()
+        builder.append(s1)
+        builder.append(s2)
+        st = builder.build()
+        assert st.parts[0] is s1
+        assert st.parts[1] is s2
+
+    def test_append_styled_text_is_flattened(self):
+        """Test that appending a StyledText adds its parts."""
+        s1 = StyledString("a")
+        s2 = StyledString("b")
+        builder = StyledTextBuilder()
+        builder.append(s1 + s2)
+        st = builder.build()
+        assert len(st.parts) == 2
+        assert st.parts[0] is s1
+        assert st.parts[1] is s2
+
+    def test_append_other_values(self):
+        """Test that other values are converted like in concatenation."""
+        builder = StyledTextBuilder()
+        builder.append(42)
+        builder.append(None)
+        st = builder.build()
+        assert [p.text for p in st.parts] == ["42", "None"]
+        assert st.parts[0].style == {}
+
+    def test_append_plain(self):
+        """Test appending plain unstyled text."""
+        builder = StyledTextBuilder()
+        builder.append_plain("hello")
+        st = builder.build()
+        assert st.parts[0].text == "hello"
+        assert st.parts[0].style == {}
+
+    def test_extend(self):
+        """Test extending with mixed values."""
+        s1 = StyledString("a")
+        builder = StyledTextBuilder()
+        builder.extend([s1, " ", StyledString("b") + "c"])
+        assert len(builder) == 4
+        assert str(builder.build()) == "a bc"
+
+    def test_build_is_independent(self):
+        """Test that later appends do not affect an already built text."""
+        builder = StyledTextBuilder()
+        builder.append_plain("a")
+        st = builder.build()
+        builder.append_plain("b")
+        assert str(st) == "a"
+        assert str(builder.build()) == "ab"
+
+
 class TestStyledStringAndTextIntegration:
     """Integration tests for StyledString and StyledText working together."""
 
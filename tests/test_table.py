@@ -0,0 +1,173 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import io
+
+import pytest
+
+from tinterm.attributes import Color, Style
+from tinterm.render import disable_colors, enable_colors, render
+from tinterm.styled import StyledString
+from tinterm.table import Column, Table
+
+
+class TestColumn:
+    """Tests for the Column specification."""
+
+    def test_defaults(self):
+        """Test the default column specification."""
+        column = Column()
+        assert column.width is None
+        assert column.align == "<"
+        assert column.style is None
+
+    def test_invalid_alignment(self):
+        """Test that unknown alignments are rejected."""
+        with pytest.raises(ValueError):
+            Column(align="left")
+
+    def test_negative_width(self):
+        """Test that negative widths are rejected."""
+        with pytest.raises(ValueError):
+            Column(width=-1)
+
+
+class TestTable:
+    """Tests for Table rendering."""
+
+    def setup_method(self):
+        """Ensure colors are enabled before each test."""
+        enable_colors()
+
+    def test_columns_sized_from_rows(self):
+        """Test that column widths come from the widest cell."""
+        lines = list(Table().render_iter([("a", "bb"), ("ccc", "d")]))
+        assert lines == ["a   bb", "ccc d"]
+
+    def test_alignment(self):
+        """Test right and center alignment."""
+        table = Table([Column(align=">"), Column(align="^"), Column()])
+        lines = list(table.render_iter([(1, "x", "|"), (100, "xxx", "|")]))
+        assert lines == ["  1  x  |", "100 xxx |"]
+
+    def test_separator(self):
+        """Test a custom column separator."""
+        lines = list(Table(separator=" | ").render_iter([("a", "b"), ("cc", "d")]))
+        assert lines == ["a  | b", "cc | d"]
+
+    def test_display_width_is_used(self):
+        """Test that wide characters are aligned by display width."""
+        lines = list(Table().render_iter([("世界", 1), ("ab", 2)]))
+        assert lines == ["世界 1", "ab   2"]
+
+    def test_styled_cells_keep_their_style(self):
+        """Test that styled cells are rendered with their own style."""
+        cell = StyledString("ok", style=Style(Color.GREEN))
+        lines = list(Table().render_iter([(cell, "x"), ("long", "y")]))
+        assert lines[0] == render(cell) + "   x"
+
+    def test_styled_text_cells(self):
+        """Test StyledText cells."""
+        cell = StyledString("a", style=Style(Color.RED)) + "b"
+        lines = list(Table().render_iter([(cell, "x"), ("abc", "y")]))
+        assert lines[0] == render(cell) + "  x"
+
+    def test_column_style_applies_to_plain_cells(self):
+        """Test that plain values get the column style."""
+        table = Table([Column(style=Style(Color.RED))])
+        assert list(table.render_iter([("a",)])) == ["\033[31ma\033[0m"]
+
+    def test_colors_disabled(self):
+        """Test that no escape codes are written when colors are disabled."""
+        disable_colors()
+        table = Table([Column(style=Style(Color.RED)), Column()])
+        cell = StyledString("b", style=Style(Color.BLUE))
+        assert list(table.render_iter([("a", cell)])) == ["a b"]
+
+    def test_color_argument(self):
+        """Test that the color argument overrides the global setting."""
+        disable_colors()
+        table = Table([Column(style=Style(Color.RED)), Column()])
+        cell = StyledString("b", style=Style(Color.BLUE))
+        assert list(table.render_iter([("a", cell)], color=True)) == [
+            "\033[31ma\033[0m \033[34mb\033[0m"
+        ]
+
+    def test_fixed_widths_do_not_sample(self):
+        """Test that fixed-width columns render rows lazily."""
+        consumed = []
+
+        def rows():
+            for i in range(10):
+                consumed.append(i)
+                yield (i,)
+
+        lines = Table([Column(width=3, align=">")]).render_iter(rows())
+        assert next(lines) == "  0"
+        assert consumed == [0]
+
+    def test_sample_size_bounds_sizing(self):
+        """Test that only the sample is used to size columns."""
+        rows = [("ab", 1), ("b", 2), ("much longer", 3)]
+        lines = list(Table(sample_size=2).render_iter(rows))
+        assert lines == ["ab 1", "b  2", "m\u2026 3"]
+
+    def test_wide_cells_are_clipped(self):
+        """Test that cells wider than a fixed column keep the alignment."""
+        table = Table(
+            [
+                Column(width=4, style=Style(Color.RED)),
+                Column(width=3, overflow="clip"),
+                Column(),
+            ]
+        )
+        styled = StyledString("styled", style=Style(Color.BLUE))
+        lines = list(table.render_iter([("abcdefg", styled, "x")], color=True))
+        assert lines == ["\033[31mabc\u2026\033[0m \033[34msty\033[0m x"]
+
+    def test_invalid_overflow(self):
+        """Test that unknown overflow modes are rejected."""
+        with pytest.raises(ValueError):
+            Column(overflow="wrap")
+
+    def test_short_rows(self):
+        """Test that missing trailing cells are left out."""
+        lines = list(Table().render_iter([("a", "b", "c"), ("dd",)]))
+        assert lines == ["a  b c", "dd"]
+
+    def test_extra_cells_are_appended(self):
+        """Test that cells beyond the layout are kept unpadded."""
+        table = Table([Column(width=2)])
+        assert list(table.render_iter([("a", "b", "c")])) == ["a  b c"]
+
+    def test_render_to_text_stream(self):
+        """Test writing rows to a text stream."""
+        stream = io.StringIO()
+        Table().render_to([("a", 1), ("bb", 2)], stream, chunk_size=4)
+        assert stream.getvalue() == "a  1\nbb 2\n"
+
+    def test_render_to_binary_stream(self):
+        """Test writing rows to a binary stream."""
+        stream = io.BytesIO()
+        Table().render_to([("世", 1)], stream)
+        assert stream.getvalue() == "世 1\n".encode("utf-8")
+
+    def test_empty_rows(self):
+        """Test that no rows produce no lines."""
+        assert list(Table().render_iter([])) == []
+
+    def teardown_method(self):
+        """Re-enable colors after each test."""
+        enable_colors()
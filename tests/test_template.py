@@ -0,0 +1,141 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+
+from tinterm.attributes import Color, Modifier, Style, StyleKey
+from tinterm.render import disable_colors, enable_colors, render
+from tinterm.styled import StyledString, StyledText
+from tinterm.template import Template
+
+
+class TestTemplate:
+    """Tests for precompiled templates."""
+
+    def setup_method(self):
+        enable_colors()
+
+    def teardown_method(self):
+        enable_colors()
+
+    def test_plain_pattern(self):
+        """Test a plain pattern with keyword and positional fields."""
+        assert Template("{a}-{b}").format(a=1, b="x") == "1-x"
+        assert Template("{} and {}").format("x", "y") == "x and y"
+
+    def test_slot_styles(self):
+        """Test that slots are wrapped in their styles."""
+        template = Template("{level}: {msg}", styles={"level": Style(Color.RED)})
+        assert template.format(level="ERROR", msg="boom") == (
+            "\033[31mERROR\033[0m: boom"
+        )
+
+    def test_slot_styles_from_dicts(self):
+        """Test that slot styles can be given as style dicts."""
+        template = Template("{x}", styles={"x": {StyleKey.MODIFIERS: [Modifier.BOLD]}})
+        assert template.format(x="!") == "\033[1m!\033[0m"
+
+    def test_styled_fragments(self):
+        """Test that the output matches rendering the equivalent StyledText."""
+        blue = Style(Color.BLUE)
+        pattern = StyledString("[", blue) + "{ts}" + StyledString("] {msg}", blue)
+        result = Template(pattern).format(ts="12:00", msg="hi")
+        expected = StyledText(
+            [
+                StyledString("[", blue),
+                StyledString("12:00"),
+                StyledString("] ", blue),
+                StyledString("hi", blue),
+            ]
+        )
+        assert result == render(expected)
+
+    def test_format_spec_and_conversion(self):
+        """Test that specs and conversions are kept."""
+        template = Template("{n:>4}|{s!r}", styles={"n": Style(Color.GREEN)})
+        assert template.format(n=7, s="x") == "\033[32m   7\033[0m|'x'"
+
+    def test_escaped_braces(self):
+        """Test that doubled braces stay literal."""
+        template = Template(StyledString("{{{x}}}", Style(Color.RED)))
+        assert template.format(x=1) == (
+            "\033[31m{\033[0m\033[31m1\033[0m\033[31m}\033[0m"
+        )
+
+    def test_styled_values(self):
+        """Test that styled values are rendered inside the slot style."""
+        value = StyledString("ok", Style(Color.GREEN))
+        assert Template("{}").format(value) == "\033[32mok\033[0m"
+        template = Template("{msg}!", styles={"msg": Style(Color.RED)})
+        assert template.format(msg=value) == ("\033[31m\033[32mok\033[0m\033[0m!")
+
+    def test_styled_values_are_aligned_by_plain_text(self):
+        """Test that padding is computed without escape codes."""
+        value = StyledString("ok", Style(Color.GREEN))
+        assert Template("{msg:>5}|").format(msg=value) == "   \033[32mok\033[0m|"
+
+    def test_styled_values_keep_the_slot_style(self):
+        """Test that the slot style continues after the value's styled parts."""
+        bold = Style(modifiers=[Modifier.BOLD])
+        value = StyledString("x", bold) + "y"
+        template = Template("{a}", {"a": Style(Color.RED)})
+        assert template.format(a=value) == ("\033[31m\033[1mx\033[0m\033[31my\033[0m")
+        # also for the padding after the value
+        template = Template("{a:<4}|", {"a": Style(Color.RED)})
+        assert template.format(a=StyledString("x", bold)) == (
+            "\033[31m\033[1mx\033[0m\033[31m   \033[0m|"
+        )
+
+    def test_repeated_styled_values(self):
+        """Test that each slot of a value restores its own style."""
+        pattern = StyledString("{0}", Style(Color.RED)) + StyledString(
+            "{0}", Style(Color.BLUE)
+        )
+        value = StyledString("x", Style(modifiers=[Modifier.BOLD])) + "y"
+        assert Template(pattern).format(value) == (
+            "\033[31m\033[1mx\033[0m\033[31my\033[0m"
+            "\033[34m\033[1mx\033[0m\033[34my\033[0m"
+        )
+
+    def test_colors_disabled(self):
+        """Test that disabled colors give the plain pattern."""
+        template = Template(
+            StyledString("{level}", Style(Color.RED)) + " {msg}",
+            styles={"msg": Style(Color.BLUE)},
+        )
+        disable_colors()
+        value = StyledString("x", Style(Color.GREEN))
+        assert template.format(level="INFO", msg=value) == "INFO x"
+
+    def test_colors_disabled_format_spec(self):
+        """Test that styled values are padded when colors are disabled."""
+        disable_colors()
+        value = StyledString("x", Style(Color.GREEN))
+        assert Template("{msg:>5}|").format(msg=value) == "    x|"
+        assert Template("{:<3}|{!r}").format(value, value) == "x  |'x'"
+
+    def test_format_map(self):
+        """Test formatting from a mapping."""
+        assert Template("{a}{b}").format_map({"a": 1, "b": 2}) == "12"
+
+    def test_missing_value(self):
+        """Test that missing values raise like str.format."""
+        with pytest.raises(KeyError):
+            Template("{a}").format()
+
+    def test_invalid_pattern(self):
+        """Test that unbalanced braces are rejected."""
+        with pytest.raises(ValueError):
+            Template("{a")
@@ -0,0 +1,172 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import io
+import os
+import sys
+
+import pytest
+
+from tinterm import terminal
+from tinterm.attributes import Color, Style
+from tinterm.render import auto_colors, enable_colors, render, render_to, use_colors
+from tinterm.styled import StyledString
+from tinterm.terminal import Capabilities, clear_cache, detect
+
+_ENVIRONMENT = ("NO_COLOR", "FORCE_COLOR", "TERM", "COLORTERM")
+
+
+@pytest.fixture
+def tty():
+    # a pseudo terminal, so detection sees a real tty
+    if not hasattr(os, "openpty"):
+        pytest.skip("pseudo terminals are not available")
+    leader, follower = os.openpty()
+    stream = open(follower, "w", closefd=False)
+    stream.leader = leader
+    yield stream
+    stream.close()
+    os.close(leader)
+    os.close(follower)
+
+
+class TestDetect:
+    """Tests for terminal capability detection."""
+
+    def setup_method(self):
+        clear_cache()
+
+    def teardown_method(self):
+        clear_cache()
+
+    @pytest.fixture(autouse=True)
+    def environment(self, monkeypatch):
+        for name in _ENVIRONMENT:
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv("TERM", "xterm")
+        return monkeypatch
+
+    def test_tty(self, tty):
+        """Test that terminals get 16 colors by default."""
+        assert detect(tty) == Capabilities(tty=True, colors=16)
+        assert detect(tty).color
+
+    def test_streams_without_fd(self):
+        """Test that in-memory streams are not terminals."""
+        assert detect(io.StringIO()) == Capabilities(tty=False, colors=0)
+
+    def test_pipe(self):
+        """Test that pipes are not terminals."""
+        read_fd, write_fd = os.pipe()
+        try:
+            with open(write_fd, "w", closefd=False) as stream:
+                assert not detect(stream).color
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def test_color_depth(self, tty, environment):
+        """Test 256 and true color detection."""
+        environment.setenv("TERM", "xterm-256color")
+        assert detect(tty).colors == 256
+        clear_cache()
+        environment.setenv("COLORTERM", "truecolor")
+        assert detect(tty).colors == 1 << 24
+
+    def test_dumb_terminal(self, tty, environment):
+        """Test that TERM=dumb disables colors."""
+        environment.setenv("TERM", "dumb")
+        assert detect(tty) == Capabilities(tty=True, colors=0)
+
+    def test_no_color(self, tty, environment):
+        """Test that NO_COLOR disables colors."""
+        environment.setenv("NO_COLOR", "1")
+        assert not detect(tty).color
+
+    def test_empty_no_color_is_ignored(self, tty, environment):
+        """Test that an empty NO_COLOR has no effect."""
+        environment.setenv("NO_COLOR", "")
+        assert detect(tty).color
+
+    @pytest.mark.parametrize(
+        "value, colors", [("1", 16), ("2", 256), ("3", 1 << 24), ("0", 0)]
+    )
+    def test_force_color(self, environment, value, colors):
+        """Test that FORCE_COLOR wins over the tty check and NO_COLOR."""
+        environment.setenv("NO_COLOR", "1")
+        environment.setenv("FORCE_COLOR", value)
+        assert detect(io.StringIO()).colors == colors
+
+    def test_default_stream_is_stdout(self, environment):
+        """Test that detect() without a stream looks at sys.stdout."""
+        environment.setattr(sys, "stdout", io.StringIO())
+        assert detect() == detect(io.StringIO())
+
+    def test_detection_is_cached(self, tty, environment):
+        """Test that each file descriptor is inspected only once."""
+        calls = []
+
+        def isatty(fd):
+            calls.append(fd)
+            return True
+
+        environment.setattr(terminal.os, "isatty", isatty)
+        for _ in range(100):
+            detect(tty)
+        assert calls == [tty.fileno()]
+
+
+class TestAutoColors:
+    """Tests for colors detected from the output stream."""
+
+    def setup_method(self):
+        clear_cache()
+        auto_colors()
+
+    def teardown_method(self):
+        clear_cache()
+        enable_colors()
+
+    @pytest.fixture(autouse=True)
+    def environment(self, monkeypatch):
+        for name in _ENVIRONMENT:
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv("TERM", "xterm")
+
+    def styled(self):
+        return StyledString("x", Style(Color.RED))
+
+    def test_render_to_terminal(self, tty):
+        """Test that render_to colors output for terminals only."""
+        stream = io.StringIO()
+        render_to(self.styled(), stream)
+        assert stream.getvalue() == "x"
+
+        render_to(self.styled(), tty)
+        tty.flush()
+        assert os.read(tty.leader, 1024) == b"\033[31mx\033[0m"
+
+    def test_render_follows_stdout(self, monkeypatch, tty):
+        """Test that render() detects colors on sys.stdout."""
+        monkeypatch.setattr(sys, "stdout", tty)
+        assert render(self.styled()) == "\033[31mx\033[0m"
+        monkeypatch.setattr(sys, "stdout", io.StringIO())
+        assert render(self.styled()) == "x"
+
+    def test_explicit_settings_win(self):
+        """Test that use_colors and color= skip detection."""
+        with use_colors(True):
+            assert render(self.styled()) == "\033[31mx\033[0m"
+        assert render(self.styled(), color=True) == "\033[31mx\033[0m"
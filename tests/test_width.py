@@ -0,0 +1,79 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from tinterm.width import char_width, display_width
+
+
+class TestCharWidth:
+    """Tests for char_width()."""
+
+    def test_ascii(self):
+        """Test that printable ASCII is one column wide."""
+        assert char_width("a") == 1
+        assert char_width(" ") == 1
+
+    def test_control_characters(self):
+        """Test that control characters take no columns."""
+        assert char_width("\x1b") == 0
+        assert char_width("\x7f") == 0
+
+    def test_wide_characters(self):
+        """Test CJK, fullwidth and emoji characters."""
+        assert char_width("世") == 2
+        assert char_width("한") == 2
+        assert char_width("Ａ") == 2
+        assert char_width("🌍") == 2
+
+    def test_zero_width_characters(self):
+        """Test combining marks and format characters."""
+        assert char_width("\u0301") == 0
+        assert char_width("\u200b") == 0
+        assert char_width("\u200d") == 0
+
+    def test_other_characters(self):
+        """Test that other characters default to one column."""
+        assert char_width("é") == 1
+        assert char_width("Ж") == 1
+        assert char_width("\u00ad") == 1
+
+
+class TestDisplayWidth:
+    """Tests for display_width()."""
+
+    def test_empty(self):
+        """Test the width of an empty string."""
+        assert display_width("") == 0
+
+    def test_ascii_fast_path(self):
+        """Test printable ASCII text."""
+        assert display_width("hello world") == 11
+
+    def test_ascii_with_controls(self):
+        """Test that ASCII control characters are not counted."""
+        assert display_width("a\tb\n") == 2
+
+    def test_mixed_text(self):
+        """Test text mixing narrow and wide characters."""
+        assert display_width("Hello 世界 🌍") == 13
+
+    def test_combining_sequence(self):
+        """Test that combining marks do not add width."""
+        assert display_width("e\u0301e") == 2
+
+    def test_emoji_presentation_selector(self):
+        """Test that VS16 widens a narrow symbol."""
+        assert display_width("\u2764") == 1
+        assert display_width("\u2764\ufe0f") == 2
+        assert display_width("\U0001f30d\ufe0f") == 2
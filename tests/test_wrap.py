@@ -0,0 +1,140 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import textwrap
+
+import pytest
+
+from tinterm.attributes import Color, Style, StyleKey
+from tinterm.styled import StyledString, StyledText
+from tinterm.wrap import Reflow, fill, wrap
+
+RED = Style(Color.RED)
+BLUE = Style(Color.BLUE)
+
+
+def _sample():
+    return (
+        StyledString("The quick brown ", style=RED)
+        + StyledString("fox jumps over the lazy dog", style=BLUE)
+        + "\n\nA second paragraph"
+    )
+
+
+class TestWrap:
+    """Tests for wrap() and fill()."""
+
+    def test_wrap_lines(self):
+        """Test that lines break at word boundaries."""
+        lines = wrap(_sample(), 10)
+        assert [str(line) for line in lines] == [
+            "The quick",
+            "brown fox",
+            "jumps over",
+            "the lazy",
+            "dog",
+            "",
+            "A second",
+            "paragraph",
+        ]
+
+    def test_wrap_keeps_styles_across_breaks(self):
+        """Test that style runs are split at line breaks."""
+        lines = wrap(_sample(), 10)
+        assert all(isinstance(line, StyledText) for line in lines)
+        assert [p.text for p in lines[1].parts] == ["brown ", "fox"]
+        assert lines[1].parts[0].style is RED
+        assert lines[1].parts[1].style is BLUE
+        assert lines[2].parts[0].style is BLUE
+
+    def test_wrap_matches_textwrap(self):
+        """Test that plain ASCII text wraps like textwrap."""
+        text = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do"
+        for width in range(11, 40):
+            lines = wrap(StyledString(text), width)
+            assert [str(line) for line in lines] == textwrap.wrap(text, width)
+
+    def test_wrap_breaks_long_words(self):
+        """Test that words longer than the width are split."""
+        lines = wrap(StyledString("abcdefghij", style=RED), 4)
+        assert [str(line) for line in lines] == ["abcd", "efgh", "ij"]
+        assert all(line.parts[0].style is RED for line in lines)
+
+    def test_wrap_uses_display_width(self):
+        """Test that wide characters count as two columns."""
+        lines = wrap(StyledString("世界 世界 ab"), 5)
+        assert [str(line) for line in lines] == ["世界", "世界", "ab"]
+
+    def test_wrap_styled_string(self):
+        """Test wrapping a single StyledString."""
+        lines = wrap(StyledString("a b", style=RED), 1)
+        assert [str(line) for line in lines] == ["a", "b"]
+
+    def test_wrap_invalid_width(self):
+        """Test that the width must be positive."""
+        with pytest.raises(ValueError):
+            wrap(StyledString("a"), 0)
+
+    def test_fill(self):
+        """Test that fill joins the wrapped lines with newlines."""
+        result = fill(_sample(), 10)
+        assert isinstance(result, StyledText)
+        assert str(result) == "\n".join(str(line) for line in wrap(_sample(), 10))
+        assert result.parts[0].style[StyleKey.FOREGROUND] == Color.RED
+
+
+class TestReflow:
+    """Tests for incremental reflow."""
+
+    def test_lines_match_wrap(self):
+        """Test that Reflow produces the same lines as wrap()."""
+        reflow = Reflow(_sample())
+        for width in (5, 10, 30, 80):
+            assert [str(line) for line in reflow.lines(width)] == [
+                str(line) for line in wrap(_sample(), width)
+            ]
+
+    def test_paragraphs(self):
+        """Test that the text is split into paragraphs."""
+        assert len(Reflow(_sample())) == 3
+
+    def test_same_width_reuses_lines(self):
+        """Test that wrapping at the same width is not repeated."""
+        reflow = Reflow(_sample())
+        first = reflow.lines(10)
+        second = reflow.lines(10)
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_fitting_paragraphs_are_not_rewrapped(self):
+        """Test that only paragraphs wider than the new width are wrapped."""
+        reflow = Reflow(StyledString("short") + "\n" + "a much longer paragraph")
+        before = reflow.lines(40)
+        after = reflow.lines(10)
+        assert after[0] is before[0]
+        assert [str(line) for line in after] == [
+            "short",
+            "a much",
+            "longer",
+            "paragraph",
+        ]
+
+    def test_append(self):
+        """Test that appended text adds new paragraphs."""
+        reflow = Reflow()
+        reflow.append(StyledString("first line", style=RED))
+        reflow.append(StyledString("second"))
+        lines = reflow.lines(6)
+        assert [str(line) for line in lines] == ["first", "line", "second"]
+        assert lines[0].parts[0].style is RED
@@ -0,0 +1,144 @@
+# Copyright 2026 Tobias Hafner
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import io
+import threading
+
+import pytest
+
+from tinterm.attributes import Color, StyleKey
+from tinterm.render import enable_colors, use_colors
+from tinterm.styled import StyledString
+from tinterm.writer import BackgroundWriter
+
+
+class CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+
+class FailingStream(io.StringIO):
+    def write(self, s):
+        raise OSError("broken pipe")
+
+
+class TestBackgroundWriter:
+    """Tests for the BackgroundWriter."""
+
+    def setup_method(self):
+        enable_colors()
+
+    def teardown_method(self):
+        enable_colors()
+
+    def test_invalid_flush_interval(self):
+        """Test that negative flush intervals are rejected."""
+        with pytest.raises(ValueError):
+            BackgroundWriter(io.StringIO(), flush_interval=-1)
+
+    def test_values_are_rendered_in_order(self):
+        """Test that styled and plain values are written in order."""
+        stream = io.StringIO()
+        with BackgroundWriter(stream) as writer:
+            writer.write(StyledString("a", style={StyleKey.FOREGROUND: Color.RED}))
+            writer.write("b")
+            writer.write(StyledString("c") + "d")
+        assert stream.getvalue() == "\033[31ma\033[0mbcd"
+
+    def test_values_are_batched(self):
+        """Test that values queued together share one write."""
+        stream = CountingStream()
+        with BackgroundWriter(stream, flush_interval=10) as writer:
+            for i in range(100):
+                writer.write(f"{i}\n")
+            writer.flush()
+        assert stream.writes == 1
+        assert stream.getvalue() == "".join(f"{i}\n" for i in range(100))
+
+    def test_flush_waits_for_writes(self):
+        """Test that flush returns once earlier values are written."""
+        stream = io.StringIO()
+        with BackgroundWriter(stream, flush_interval=10) as writer:
+            writer.write("x")
+            writer.flush()
+            assert stream.getvalue() == "x"
+
+    def test_minimal(self):
+        """Test rendering with minimal escape codes."""
+        stream = io.StringIO()
+        red = {StyleKey.FOREGROUND: Color.RED}
+        with BackgroundWriter(stream, minimal=True) as writer:
+            writer.write(StyledString("a", style=red) + StyledString("b", style=red))
+        assert stream.getvalue() == "\033[31mab\033[0m"
+
+    def test_color_setting_of_creating_context(self):
+        """Test that the writer thread follows the creator's color setting."""
+        stream = io.StringIO()
+        red = {StyleKey.FOREGROUND: Color.RED}
+        with use_colors(False):
+            writer = BackgroundWriter(stream)
+        with writer:
+            writer.write(StyledString("a", style=red))
+        with BackgroundWriter(stream, color=True) as writer:
+            with use_colors(False):
+                writer.write(StyledString("b", style=red))
+        assert stream.getvalue() == "a\033[31mb\033[0m"
+
+    def test_binary_stream(self):
+        """Test writing to a binary stream."""
+        stream = io.BytesIO()
+        with BackgroundWriter(stream) as writer:
+            writer.write("世")
+        assert stream.getvalue() == "世".encode()
+
+    def test_write_after_close(self):
+        """Test that a closed writer rejects values."""
+        writer = BackgroundWriter(io.StringIO())
+        writer.close()
+        writer.close()
+        with pytest.raises(ValueError):
+            writer.write("x")
+
+    def test_stream_errors_are_reported(self):
+        """Test that errors in the writer thread surface on flush."""
+        writer = BackgroundWriter(FailingStream())
+        writer.write("x")
+        with pytest.raises(OSError):
+            writer.flush()
+        writer.close()
+
+    def test_many_threads(self):
+        """Test writing from several threads at once."""
+        stream = io.StringIO()
+
+        def work(n):
+            for _ in range(500):
+                writer.write(f"{n}\n")
+
+        with BackgroundWriter(stream) as writer:
+            threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 4000
+        assert all(lines.count(str(n)) == 500 for n in range(8))